@@ -0,0 +1,59 @@
+"""add stale detection indexes
+
+Revision ID: p0q9r2s3t4u5
+Revises: o9p8q1r2s3t4
+Create Date: 2026-10-18 10:00:00.000000
+
+Adds a partial index on scrape_runs(started_at) covering only RUNNING runs,
+so the stale-run watchdog reads the small RUNNING working set instead of
+scanning all runs, and a (scrape_run_id, started_at DESC) index on
+scrape_phase_logs so the per-run MAX(started_at) becomes an index range scan.
+Both are built CONCURRENTLY to avoid locking writes on live tables.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'p0q9r2s3t4u5'
+down_revision: Union[str, Sequence[str], None] = 'o9p8q1r2s3t4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create stale detection indexes."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_scrape_runs_running',
+            'scrape_runs',
+            ['started_at'],
+            unique=False,
+            postgresql_where=sa.text("status = 'running'"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_scrape_phase_logs_run_started',
+            'scrape_phase_logs',
+            ['scrape_run_id', sa.text('started_at DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop stale detection indexes."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_scrape_phase_logs_run_started',
+            table_name='scrape_phase_logs',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_scrape_runs_running',
+            table_name='scrape_runs',
+            postgresql_concurrently=True,
+        )
@@ -34,7 +34,7 @@ from src.caching.odds_cache import OddsCache
 from src.caching.warmup import warm_cache_from_db
 from src.db.engine import async_session_factory
 from src.storage import AsyncWriteQueue
-from src.scheduling.jobs import set_app_state
+from src.scheduling.jobs import reset_clients, set_app_state
 from src.scheduling.scheduler import (
     configure_scheduler,
     shutdown_scheduler,
@@ -49,47 +49,40 @@ from src.scraping.logging import configure_logging
 DEFAULT_TIMEOUT = 30.0
 """Default HTTP request timeout in seconds for all platform clients."""
 
+# Connect and pool-acquire budgets are much tighter than the read budget:
+# a slow handshake or an exhausted pool should fail fast as a retryable
+# timeout (surfaced as NetworkError) instead of adding silent latency.
+CLIENT_TIMEOUT = httpx.Timeout(DEFAULT_TIMEOUT, connect=5.0, pool=5.0)
+"""HTTP timeouts for the shared platform client."""
+
 # Connection pool limits for concurrent scraping (Phase 56: increased for intra-batch concurrency)
-# max_connections: total connections across all hosts
+# max_connections: total connections across all hosts (one pool shared by all platforms)
 # max_keepalive_connections: connections to keep alive for reuse
-# With 10 concurrent events x 3 platforms x ~3 connections + retries = ~90 peak, 200 max gives headroom
+# keepalive_expiry: seconds an idle connection stays pooled
+# With 10 concurrent events x 3 platforms x ~3 connections + retries = ~90 peak, 200 max gives headroom.
+# Only three hosts are ever contacted, so pooled sockets are almost always
+# reusable: keep the whole pool alive and hold idle sockets for 60s so bursts
+# (and retries) reuse connections instead of paying a fresh TCP + TLS handshake.
+# The client also negotiates HTTP/2 (via ALPN, falling back to HTTP/1.1), so
+# concurrent requests to one host multiplex over a single connection and the
+# repeated per-request headers are HPACK-compressed. With the brotli extra
+# installed, httpx's default Accept-Encoding advertises br alongside gzip and
+# decodes it transparently (the platform headers leave Accept-Encoding unset).
 CONNECTION_LIMITS = httpx.Limits(
     max_connections=200,
-    max_keepalive_connections=100,
+    max_keepalive_connections=200,
+    keepalive_expiry=60.0,
 )
 """HTTP connection pool limits for concurrent scraping operations."""
 
 
-# Platform-specific headers (copied from scraper configs to avoid import issues)
-SPORTYBET_HEADERS = {
-    "accept": "*/*",
-    "accept-language": "en",
-    "clientid": "web",
-    "operid": "2",
-    "platform": "web",
-    "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36",
-}
-
-BETPAWA_HEADERS = {
-    "accept": "*/*",
-    "accept-language": "en-GB,en-US;q=0.9,en;q=0.8",
-    "devicetype": "web",
-    "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36",
-    "x-pawa-brand": "betpawa-nigeria",
-}
-
-BET9JA_HEADERS = {
-    "accept": "application/json, text/plain, */*",
-    "accept-language": "en-GB,en-US;q=0.9,en;q=0.8",
-    "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36",
-}
-
-
 class AppState(TypedDict):
-    """Application state containing HTTP clients for each platform.
+    """Application state containing the HTTP client for each platform.
 
-    These clients are shared across all requests and managed by the
-    lifespan context manager.
+    All three names refer to one shared HTTP/2-capable client, managed by
+    the lifespan context manager, so the platforms share a single connection
+    pool and TLS context. The platform wrappers send absolute URLs and their own
+    headers on every request.
 
     Attributes:
         sportybet_client: HTTP client for SportyBet API.
@@ -106,24 +99,25 @@ class AppState(TypedDict):
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Async lifespan context manager for HTTP client and scheduler lifecycle.
 
-    Creates AsyncClient instances at startup and closes them at shutdown.
-    Clients are stored in app.state for dependency injection.
+    Creates the shared AsyncClient at startup and closes it at shutdown.
+    It is stored in app.state for dependency injection.
     Scheduler is configured and started after clients are available.
 
     Startup sequence:
-    1. Create HTTP clients for all platforms
+    1. Create the shared HTTP client for all platforms
     2. Configure structured logging
-    3. Initialize scheduler with app state access
-    4. Recover stale runs from previous process
+    3. Recover stale runs from previous process
+    4. Start scheduler and sync intervals from settings
     5. Warm in-memory odds cache from database
     6. Start async write queue
-    7. Initialize WebSocket connection manager
-    8. Set up cache-to-WebSocket bridge
+    7. Give scheduled jobs app state access
+    8. Initialize WebSocket connection manager
+    9. Set up cache-to-WebSocket bridge
 
     Shutdown sequence:
     1. Drain and stop write queue
     2. Shutdown scheduler gracefully
-    3. Close HTTP clients (handled by context managers)
+    3. Close the HTTP client (handled by the context manager)
 
     Args:
         app: The FastAPI application instance.
@@ -132,89 +126,82 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         None - resources are attached to app.state.
     """
     async with httpx.AsyncClient(
-        base_url="https://www.sportybet.com",
-        headers=SPORTYBET_HEADERS,
-        timeout=DEFAULT_TIMEOUT,
+        http2=True,
+        timeout=CLIENT_TIMEOUT,
         limits=CONNECTION_LIMITS,
-    ) as sportybet_client:
-        async with httpx.AsyncClient(
-            base_url="https://www.betpawa.ng",
-            headers=BETPAWA_HEADERS,
-            timeout=DEFAULT_TIMEOUT,
-            limits=CONNECTION_LIMITS,
-        ) as betpawa_client:
-            async with httpx.AsyncClient(
-                base_url="https://sports.bet9ja.com",
-                headers=BET9JA_HEADERS,
-                timeout=DEFAULT_TIMEOUT,
-                limits=CONNECTION_LIMITS,
-            ) as bet9ja_client:
-                # Configure structured logging (dev mode by default)
-                configure_logging(json_output=False)
-
-                # Store clients in app state for dependency injection
-                app.state.sportybet_client = sportybet_client
-                app.state.betpawa_client = betpawa_client
-                app.state.bet9ja_client = bet9ja_client
-
-                # Initialize scheduler with app state access
-                set_app_state(app.state)
-
-                # Recover any runs left in RUNNING from previous process
-                recovered = await recover_stale_runs_on_startup()
-
-                configure_scheduler()
-                start_scheduler()
-
-                # Sync scheduler interval from stored settings
-                await sync_settings_on_startup()
-
-                # --- In-memory odds cache warmup ---
-                log = structlog.get_logger("src.api.app")
-                odds_cache = OddsCache()
-                app.state.odds_cache = odds_cache
-
-                t0 = perf_counter()
-                async with async_session_factory() as db:
-                    warmup_stats = await warm_cache_from_db(odds_cache, db)
-                warmup_ms = (perf_counter() - t0) * 1000
-                log.info(
-                    "cache.warmup.done",
-                    warmup_ms=round(warmup_ms, 1),
-                    **warmup_stats,
-                )
-
-                # --- Async write queue ---
-                t0 = perf_counter()
-                write_queue = AsyncWriteQueue(
-                    session_factory=async_session_factory,
-                    maxsize=50,
-                )
-                await write_queue.start()
-                app.state.write_queue = write_queue
-                wq_ms = (perf_counter() - t0) * 1000
-                log.info(
-                    "write_queue_started",
-                    startup_ms=round(wq_ms, 1),
-                )
-
-                # --- WebSocket connection manager ---
-                ws_manager = ConnectionManager()
-                app.state.ws_manager = ws_manager
-                log.info("ws_manager_ready")
-
-                # --- Cache-to-WebSocket bridge ---
-                create_cache_update_bridge(odds_cache, ws_manager)
-                log.info("ws.cache_bridge.ready")
-
-                yield
-
-                # --- Shutdown ---
-                # Stop write queue first (drains remaining items)
-                await write_queue.stop()
-
-                # Shutdown scheduler gracefully
-                shutdown_scheduler()
+    ) as http_client:
+        # Configure structured logging (dev mode by default)
+        configure_logging(json_output=False)
+
+        # Store the shared client under each platform's name for
+        # dependency injection (wrappers pass full URLs and headers)
+        app.state.sportybet_client = http_client
+        app.state.betpawa_client = http_client
+        app.state.bet9ja_client = http_client
+
+        # Recover any runs left in RUNNING from previous process
+        recovered = await recover_stale_runs_on_startup()
+
+        configure_scheduler()
+        start_scheduler()
+
+        # Sync scheduler interval from stored settings
+        await sync_settings_on_startup()
+
+        # --- In-memory odds cache warmup ---
+        log = structlog.get_logger("src.api.app")
+        odds_cache = OddsCache()
+        app.state.odds_cache = odds_cache
+
+        t0 = perf_counter()
+        async with async_session_factory() as db:
+            warmup_stats = await warm_cache_from_db(odds_cache, db)
+        warmup_ms = (perf_counter() - t0) * 1000
+        log.info(
+            "cache.warmup.done",
+            warmup_ms=round(warmup_ms, 1),
+            **warmup_stats,
+        )
+
+        # --- Async write queue ---
+        t0 = perf_counter()
+        write_queue = AsyncWriteQueue(
+            session_factory=async_session_factory,
+            maxsize=50,
+        )
+        await write_queue.start()
+        app.state.write_queue = write_queue
+        wq_ms = (perf_counter() - t0) * 1000
+        log.info(
+            "write_queue_started",
+            startup_ms=round(wq_ms, 1),
+        )
+
+        # Give jobs app state access once clients, cache, and write
+        # queue are all in place (first scrape tick is an interval away)
+        set_app_state(app.state)
+
+        # --- WebSocket connection manager ---
+        ws_manager = ConnectionManager()
+        app.state.ws_manager = ws_manager
+        log.info("ws_manager_ready")
+
+        # --- Cache-to-WebSocket bridge ---
+        create_cache_update_bridge(odds_cache, ws_manager)
+        log.info("ws.cache_bridge.ready")
+
+        yield
+
+        # --- Shutdown ---
+        # Shutdown scheduler first: in-flight scrapes finish and enqueue
+        # their last batches while the write queue worker is still running
+        await shutdown_scheduler()
+
+        # Stop write queue (drains remaining items)
+        await write_queue.stop()
+
+        # Drop job client wrappers before the httpx client closes
+        reset_clients()
 
 
 def create_app() -> FastAPI:
@@ -35,8 +35,7 @@ async def get_settings_values(db: AsyncSession) -> tuple[int, int]:
     Returns:
         Tuple of (odds_retention_days, match_retention_days).
     """
-    result = await db.execute(select(Settings).where(Settings.id == 1))
-    settings = result.scalar_one_or_none()
+    settings = await db.get(Settings, 1)
 
     if settings is None:
         return 30, 30  # Default values
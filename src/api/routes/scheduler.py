@@ -1,10 +1,7 @@
 """Scheduler monitoring endpoints for status and run history."""
 
-import httpx
 import structlog
-from apscheduler.schedulers.base import STATE_PAUSED
-from apscheduler.triggers.interval import IntervalTrigger
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from pydantic import BaseModel
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -56,23 +53,18 @@ async def get_scheduler_status() -> SchedulerStatus:
     """
     jobs = []
     for job in scheduler.get_jobs():
-        interval_minutes = None
-        if isinstance(job.trigger, IntervalTrigger):
-            interval_minutes = int(job.trigger.interval.total_seconds() / 60)
         jobs.append(
             JobStatus(
                 id=job.id,
                 next_run=job.next_run_time,
-                trigger_type=type(job.trigger).__name__,
-                interval_minutes=interval_minutes,
+                trigger_type="interval",
+                interval_minutes=int(job.interval_seconds / 60),
             )
         )
 
-    # Check if scheduler is paused using APScheduler's state property
-    # STATE_PAUSED indicates scheduler.pause() was called
-    paused = scheduler.state == STATE_PAUSED
-
-    return SchedulerStatus(running=scheduler.running, paused=paused, jobs=jobs)
+    return SchedulerStatus(
+        running=scheduler.running, paused=scheduler.paused, jobs=jobs
+    )
 
 
 @router.post("/pause", response_model=PauseResumeResponse)
@@ -234,6 +226,7 @@ async def get_platform_health(
 
 @router.post("/discover-tournaments", response_model=TournamentDiscoveryResponse)
 async def discover_tournaments(
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ) -> TournamentDiscoveryResponse:
     """Trigger tournament discovery for SportyBet and Bet9ja.
@@ -243,6 +236,7 @@ async def discover_tournaments(
     are created and existing ones are updated with latest metadata.
 
     Args:
+        request: FastAPI request object for accessing app state.
         db: Async database session (injected).
 
     Returns:
@@ -253,12 +247,12 @@ async def discover_tournaments(
     """
     log.info("Starting tournament discovery")
 
-    async with httpx.AsyncClient(timeout=30.0) as http_client:
-        sportybet_client = SportyBetClient(http_client)
-        bet9ja_client = Bet9jaClient(http_client)
+    # Reuse the app's pooled HTTP client rather than a throwaway one
+    sportybet_client = SportyBetClient(request.app.state.sportybet_client)
+    bet9ja_client = Bet9jaClient(request.app.state.bet9ja_client)
 
-        service = TournamentDiscoveryService()
-        results = await service.discover_all(sportybet_client, bet9ja_client, db)
+    service = TournamentDiscoveryService()
+    results = await service.discover_all(sportybet_client, bet9ja_client, db)
 
     # Get total tournament count
     count_result = await db.execute(select(func.count(CompetitorTournament.id)))
@@ -290,6 +284,7 @@ async def discover_tournaments(
 
 @router.post("/scrape-competitor-events", response_model=CompetitorScrapeResponse)
 async def scrape_competitor_events(
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ) -> CompetitorScrapeResponse:
     """Scrape all events from competitor platforms (SportyBet and Bet9ja).
@@ -299,6 +294,7 @@ async def scrape_competitor_events(
     if one platform fails, the other continues.
 
     Args:
+        request: FastAPI request object for accessing app state.
         db: Async database session (injected).
 
     Returns:
@@ -319,12 +315,12 @@ async def scrape_competitor_events(
     log.info("Starting competitor event scraping")
     start_time = time.perf_counter()
 
-    async with httpx.AsyncClient(timeout=60.0) as http_client:
-        sportybet_client = SportyBetClient(http_client)
-        bet9ja_client = Bet9jaClient(http_client)
+    # Reuse the app's pooled HTTP client rather than a throwaway one
+    sportybet_client = SportyBetClient(request.app.state.sportybet_client)
+    bet9ja_client = Bet9jaClient(request.app.state.bet9ja_client)
 
-        service = CompetitorEventScrapingService(sportybet_client, bet9ja_client)
-        results = await service.scrape_all(db)
+    service = CompetitorEventScrapingService(sportybet_client, bet9ja_client)
+    results = await service.scrape_all(db)
 
     end_time = time.perf_counter()
     duration_ms = int((end_time - start_time) * 1000)
@@ -89,8 +89,8 @@ async def trigger_scrape(
         trigger="api",
     )
     db.add(scrape_run)
+    # INSERT ... RETURNING populates id and started_at (eager server defaults)
     await db.commit()
-    await db.refresh(scrape_run)
     scrape_run_id = scrape_run.id
 
     # Build scraper clients from app state
@@ -99,8 +99,7 @@ async def trigger_scrape(
     bet9ja = Bet9jaClient(request.app.state.bet9ja_client)
 
     # Get settings for EventCoordinator tuning
-    settings_result = await db.execute(select(Settings).where(Settings.id == 1))
-    settings = settings_result.scalar_one_or_none()
+    settings = await db.get(Settings, 1)
 
     # Create coordinator
     coordinator = EventCoordinator.from_settings(
@@ -476,7 +475,6 @@ async def retry_scrape_run(
     )
     db.add(retry_run)
     await db.commit()
-    await db.refresh(retry_run)
 
     # Build EventCoordinator and execute scrape
     sportybet = SportyBetClient(request.app.state.sportybet_client)
@@ -484,8 +482,7 @@ async def retry_scrape_run(
     bet9ja = Bet9jaClient(request.app.state.bet9ja_client)
 
     # Get settings for EventCoordinator tuning
-    settings_result = await db.execute(select(Settings).where(Settings.id == 1))
-    settings = settings_result.scalar_one_or_none()
+    settings = await db.get(Settings, 1)
 
     coordinator = EventCoordinator.from_settings(
         betpawa_client=betpawa,
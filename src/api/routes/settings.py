@@ -1,12 +1,12 @@
 """Settings API endpoints for scraping configuration."""
 
 from fastapi import APIRouter, Depends
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.schemas.settings import SettingsResponse, SettingsUpdate
 from src.db.engine import get_db
 from src.db.models.settings import Settings
+from src.scheduling.jobs import invalidate_settings_cache
 from src.scheduling.scheduler import update_scheduler_interval
 
 router = APIRouter(prefix="/settings", tags=["settings"])
@@ -21,8 +21,7 @@ async def get_or_create_settings(db: AsyncSession) -> Settings:
     Returns:
         Settings object with id=1.
     """
-    result = await db.execute(select(Settings).where(Settings.id == 1))
-    settings = result.scalar_one_or_none()
+    settings = await db.get(Settings, 1)
 
     if settings is None:
         # Create default settings if not exists
@@ -80,11 +79,14 @@ async def update_settings(
     """
     settings = await get_or_create_settings(db)
 
-    # Update only provided fields
+    # Update only provided fields. Reschedule only when the interval actually
+    # changes, so re-saving the form leaves the scrape tick undisturbed.
+    interval_changed = (
+        update.scrape_interval_minutes is not None
+        and update.scrape_interval_minutes != settings.scrape_interval_minutes
+    )
     if update.scrape_interval_minutes is not None:
         settings.scrape_interval_minutes = update.scrape_interval_minutes
-        # Update scheduler interval at runtime
-        update_scheduler_interval(update.scrape_interval_minutes)
 
     if update.enabled_platforms is not None:
         # Validate platform slugs
@@ -124,4 +126,11 @@ async def update_settings(
     await db.commit()
     await db.refresh(settings)
 
+    # Scheduled jobs pick up the new values on their next tick
+    invalidate_settings_cache()
+
+    # Update scheduler interval at runtime, after the new value is persisted
+    if interval_changed:
+        update_scheduler_interval(settings.scrape_interval_minutes)
+
     return SettingsResponse.model_validate(settings)
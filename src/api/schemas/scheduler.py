@@ -16,7 +16,7 @@ class JobStatus(BaseModel):
     Attributes:
         id: Unique job identifier.
         next_run: Scheduled next execution time.
-        trigger_type: Type of trigger (e.g., 'IntervalTrigger').
+        trigger_type: Type of trigger (always 'interval').
         interval_minutes: Interval in minutes for recurring jobs.
     """
 
@@ -7,6 +7,7 @@ grouped by topic. Designed for real-time odds updates and scrape progress.
 import asyncio
 
 import structlog
+from pydantic_core import to_json
 from starlette.websockets import WebSocket, WebSocketDisconnect
 
 log = structlog.get_logger("src.api.websocket.manager")
@@ -15,6 +16,22 @@ log = structlog.get_logger("src.api.websocket.manager")
 TOPICS = {"scrape_progress", "odds_updates"}
 
 
+def _encode(message: dict) -> str:
+    """Serialize a message once for fan-out to many sockets.
+
+    Uses pydantic-core's Rust JSON encoder, which is several times faster
+    than stdlib json and emits the same compact, non-ASCII-escaped output
+    as WebSocket.send_json().
+
+    Args:
+        message: JSON-serializable dict.
+
+    Returns:
+        Encoded JSON text frame payload.
+    """
+    return to_json(message).decode()
+
+
 class ConnectionManager:
     """Manages WebSocket connections with topic-based pub/sub.
 
@@ -90,7 +107,9 @@ class ConnectionManager:
     async def broadcast(self, message: dict, topic: str) -> None:
         """Send a JSON message to all subscribers of a topic.
 
-        Dead connections are silently removed after iteration.
+        The message is serialized once and the same text frame is written
+        to every subscriber. Dead connections are silently removed after
+        iteration.
 
         Args:
             message: JSON-serializable dict to send.
@@ -101,10 +120,11 @@ class ConnectionManager:
         if not subscribers:
             return
 
+        payload = _encode(message)
         dead: list[WebSocket] = []
         for ws in subscribers:
             try:
-                await ws.send_json(message)
+                await ws.send_text(payload)
             except (WebSocketDisconnect, RuntimeError):
                 dead.append(ws)
 
@@ -123,10 +143,11 @@ class ConnectionManager:
         if not all_ws:
             return
 
+        payload = _encode(message)
         dead: list[WebSocket] = []
         for ws in all_ws:
             try:
-                await ws.send_json(message)
+                await ws.send_text(payload)
             except (WebSocketDisconnect, RuntimeError):
                 dead.append(ws)
 
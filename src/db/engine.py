@@ -7,6 +7,9 @@ FastAPI endpoints via dependency injection.
 Configuration:
     - Pool size: 10 connections
     - Max overflow: 20 additional connections under load
+    - LIFO checkout: periodic jobs reuse the most recently returned (warm)
+      connection instead of cycling through the whole pool
+    - Recycle: connections are replaced after 30 minutes
     - expire_on_commit=False: Required for async sessions to prevent
       DetachedInstanceError when accessing lazy-loaded attributes
 
@@ -43,6 +46,8 @@ engine = create_async_engine(
     get_database_url(),
     pool_size=10,
     max_overflow=20,
+    pool_use_lifo=True,
+    pool_recycle=1800,
     echo=False,
 )
 
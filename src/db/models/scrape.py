@@ -10,7 +10,7 @@ from datetime import datetime
 from enum import StrEnum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import JSON, ForeignKey, Index, String, Text, func
+from sqlalchemy import JSON, ForeignKey, Index, String, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db.base import Base
@@ -157,6 +157,12 @@ class ScrapeRun(Base):
     __table_args__ = (
         Index("idx_scrape_runs_status", "status"),
         Index("idx_scrape_runs_started", "started_at"),
+        # Partial index over the RUNNING working set (stale-run watchdog)
+        Index(
+            "ix_scrape_runs_running",
+            "started_at",
+            postgresql_where=text("status = 'running'"),
+        ),
     )
 
 
@@ -244,4 +250,12 @@ class ScrapePhaseLog(Base):
     # Relationship back to parent scrape run
     scrape_run: Mapped["ScrapeRun"] = relationship(back_populates="phase_logs")
 
-    __table_args__ = (Index("idx_scrape_phase_logs_run_id", "scrape_run_id"),)
+    __table_args__ = (
+        Index("idx_scrape_phase_logs_run_id", "scrape_run_id"),
+        # Last activity per run: MAX(started_at) as an index range scan
+        Index(
+            "ix_scrape_phase_logs_run_started",
+            "scrape_run_id",
+            text("started_at DESC"),
+        ),
+    )
@@ -1,6 +1,6 @@
 """Scheduling module for periodic scraping jobs."""
 
-from src.scheduling.jobs import scrape_all_platforms, set_app_state
+from src.scheduling.jobs import JobContext, job_context, scrape_all_platforms, set_app_state
 from src.scheduling.scheduler import (
     configure_scheduler,
     scheduler,
@@ -9,7 +9,9 @@ from src.scheduling.scheduler import (
 )
 
 __all__ = [
+    "JobContext",
     "configure_scheduler",
+    "job_context",
     "scheduler",
     "scrape_all_platforms",
     "set_app_state",
@@ -1,46 +1,70 @@
 """Scheduled job functions for periodic scraping and cleanup.
 
-This module contains the async job functions invoked by APScheduler:
+This module contains the async job functions invoked by the scheduler:
 
 Jobs:
     scrape_all_platforms(): Main scraping job (default: every 5 minutes)
-    cleanup_old_data(): Data retention cleanup (default: every 24 hours)
+    cleanup_old_data(): Data retention cleanup, launched from the tail of
+        scrape_all_platforms() once cleanup_frequency_hours have elapsed
+        since the last successful run (default: every 24 hours)
 
 Integration:
-    Jobs access app.state via set_app_state() called during lifespan.
-    This provides HTTP clients, OddsCache, and AsyncWriteQueue.
+    Jobs receive a JobContext (job_context) via scheduler job kwargs. Its
+    app_state is set via set_app_state() called during lifespan and provides
+    HTTP clients, OddsCache, and AsyncWriteQueue. set_app_state() also builds
+    the platform client wrappers once; reset_clients() drops them.
 
 Coordination:
-    is_scraping_active() allows cleanup to check if scraping is in progress
-    and skip to avoid conflicts (cleanup deletes while scrape inserts).
+    JobContext.scraping_idle is cleared while a scrape runs. Cleanup waits on
+    it for a bounded window instead of skipping outright, to avoid conflicts
+    (cleanup deletes while scrape inserts). is_scraping_active() exposes it.
+
+Settings Cache:
+    The singleton Settings row is cached in-process for
+    SETTINGS_CACHE_TTL_SECONDS so each job tick does not pay a DB round-trip.
+    get_cached_settings() exposes the same cache to the scheduler. The
+    settings API calls invalidate_settings_cache() after updates.
 
 Scrape Job Flow:
-    1. Create ScrapeRun record with RUNNING status
+    1. Create ScrapeRun record with RUNNING status, concurrently with
+       TournamentDiscoveryService.discover_all() on its own session;
+       a discovery failure marks the ScrapeRun FAILED
     2. Create ProgressBroadcaster for SSE streaming
-    3. Run TournamentDiscoveryService.discover_all()
-    4. Create EventCoordinator.from_settings()
-    5. Execute coordinator.run_full_cycle(), publish progress
-    6. Update ScrapeRun with results, evict expired cache entries
-    7. Clean up broadcaster
-
-APScheduler Configuration:
-    Jobs are configured in src/scheduling/scheduler.py with IntervalTrigger.
+    3. Create EventCoordinator.from_settings()
+    4. Execute coordinator.run_full_cycle(), publish progress
+    5. Update ScrapeRun with results, evict expired cache entries
+    6. Clean up broadcaster
+    7. Launch cleanup_old_data() in the background if it is due (on every
+       exit, including skipped and failed scrapes)
+
+Scheduler Configuration:
+    Jobs are configured in src/scheduling/scheduler.py as fixed intervals.
     Intervals can be updated at runtime via update_scheduler_interval().
 """
 
+import asyncio
 import logging
-from datetime import datetime, timedelta, timezone
-from typing import Any
+import time
+from collections.abc import Awaitable, Callable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import Any, Final
 
 import structlog
-from sqlalchemy import delete, func, select, text
+from sqlalchemy import JSON, BigInteger, func, insert, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from src.db.engine import async_session_factory
+from src.db.models.cleanup_run import CleanupRun
 from src.db.models.scrape import ScrapeRun, ScrapeStatus
 from src.db.models.settings import Settings
 from src.db.models.storage_alert import StorageAlert
 from src.db.models.storage_sample import StorageSample
-from src.scraping.broadcaster import progress_registry
+from src.scheduling.timeutil import UTC, utcnow
+from src.scraping.broadcaster import CoalescingBroadcaster, progress_registry
 from src.scraping.clients import Bet9jaClient, BetPawaClient, SportyBetClient
 from src.scraping.event_coordinator import EventCoordinator
 from src.scraping.schemas import Platform, ScrapeProgress
@@ -48,11 +72,330 @@ from src.scraping.tournament_discovery import TournamentDiscoveryService
 
 logger = logging.getLogger(__name__)
 
-# Module-level reference to app.state, set during lifespan startup
-_app_state: Any = None
+# Structured logger for the storage sampling job, bound once at import
+storage_log = structlog.get_logger("src.scheduling.jobs.storage")
+
+# Settings slug -> Platform enum, used to resolve enabled_platforms.
+# Read-only view so no caller can mutate the shared mapping.
+_SLUG_TO_PLATFORM: Final[Mapping[str, Platform]] = MappingProxyType({
+    "sportybet": Platform.SPORTYBET,
+    "betpawa": Platform.BETPAWA,
+    "bet9ja": Platform.BET9JA,
+})
+
+# Weekday (Monday=0) on which storage sampling uses exact per-table sizes
+EXACT_SIZES_WEEKDAY = 6
+
+# Exact per-table sizes (heap + indexes + TOAST); opens every relation
+_EXACT_SIZES_QUERY = text("""
+    SELECT
+        COALESCE(
+            json_object_agg(
+                relname,
+                pg_total_relation_size(quote_ident(relname))
+            ),
+            '{}'::json
+        ) as table_sizes,
+        pg_database_size(current_database()) as total_bytes
+    FROM pg_stat_user_tables
+""").columns(table_sizes=JSON, total_bytes=BigInteger)
+
+# Approximate per-table sizes from catalog page counts (updated by
+# VACUUM/ANALYZE). Same table set and same scope as the exact query (heap +
+# indexes + TOAST and its index), so approximate and exact samples compare.
+_APPROX_SIZES_QUERY = text("""
+    SELECT
+        COALESCE(
+            json_object_agg(
+                s.relname,
+                (
+                    c.relpages::bigint
+                    + COALESCE(toast.relpages, 0)
+                    + COALESCE((
+                        SELECT SUM(i.relpages)::bigint
+                        FROM pg_index ix
+                        JOIN pg_class i ON i.oid = ix.indexrelid
+                        WHERE ix.indrelid IN (c.oid, c.reltoastrelid)
+                    ), 0)
+                ) * current_setting('block_size')::bigint
+            ),
+            '{}'::json
+        ) as table_sizes,
+        pg_database_size(current_database()) as total_bytes
+    FROM pg_stat_user_tables s
+    JOIN pg_class c ON c.oid = s.relid
+    LEFT JOIN pg_class toast ON toast.oid = c.reltoastrelid
+""").columns(table_sizes=JSON, total_bytes=BigInteger)
+
+# Units for _format_bytes(), indexed by power of 1024
+_BYTE_UNITS: Final = ("B", "KB", "MB", "GB", "TB")
+
+# Static progress skeletons for the coordinator event loop and failure path.
+# Built with model_construct() (no validation), copied by _progress_from().
+_CYCLE_START_PROGRESS: Final = ScrapeProgress.model_construct(
+    platform=None,
+    phase="starting",
+    current=0,
+    total=3,
+    message="Starting event-centric scrape cycle",
+)
+_DISCOVERY_PROGRESS: Final = ScrapeProgress.model_construct(
+    platform=None, phase="discovery", current=1, total=3
+)
+_BATCH_PROGRESS: Final = ScrapeProgress.model_construct(
+    platform=None, phase="scraping", current=2, total=3
+)
+_COMPLETED_PROGRESS: Final = ScrapeProgress.model_construct(
+    platform=None, phase="completed", current=3, total=3
+)
+_FAILED_PROGRESS: Final = ScrapeProgress.model_construct(
+    platform=None, phase="failed", current=0, total=3
+)
+
+
+def _progress_from(template: ScrapeProgress, **update: Any) -> ScrapeProgress:
+    """Copy a progress template with a fresh timestamp and dynamic fields.
+
+    Args:
+        template: One of the module-level progress skeletons.
+        **update: Field values to override on the copy.
+
+    Returns:
+        New ScrapeProgress instance (not re-validated).
+    """
+    update["timestamp"] = utcnow()
+    return template.model_copy(update=update)
+
+
+@dataclass
+class _CycleOutcome:
+    """Results collected from coordinator progress events during a scrape."""
+
+    total_events: int = 0
+    failed_count: int = 0
+    final_status: ScrapeStatus = ScrapeStatus.COMPLETED
+
+
+async def _on_cycle_start(
+    event: dict, publisher: CoalescingBroadcaster, outcome: _CycleOutcome
+) -> None:
+    """Publish the CYCLE_START progress update."""
+    await publisher.publish_coalesced(_progress_from(_CYCLE_START_PROGRESS))
+
+
+async def _on_discovery_complete(
+    event: dict, publisher: CoalescingBroadcaster, outcome: _CycleOutcome
+) -> None:
+    """Publish the DISCOVERY_COMPLETE progress update."""
+    total = event.get("total_events", 0)
+    await publisher.publish_coalesced(_progress_from(
+        _DISCOVERY_PROGRESS,
+        message=f"Discovered {total} events across all platforms",
+        events_count=total,
+    ))
+
+
+async def _on_batch_complete(
+    event: dict, publisher: CoalescingBroadcaster, outcome: _CycleOutcome
+) -> None:
+    """Publish a BATCH_COMPLETE progress update."""
+    processed = event.get("events_stored", 0)
+    await publisher.publish_coalesced(_progress_from(
+        _BATCH_PROGRESS,
+        message=f"Processed batch: {processed} events stored",
+        events_count=processed,
+    ))
+
+
+async def _on_cycle_complete(
+    event: dict, publisher: CoalescingBroadcaster, outcome: _CycleOutcome
+) -> None:
+    """Publish CYCLE_COMPLETE and record totals and final status in outcome."""
+    total_events = event.get("events_scraped", 0)
+    failed_count = event.get("events_failed", 0)
+    total_ms = event.get("total_timing_ms", 0)
+
+    await publisher.publish_coalesced(_progress_from(
+        _COMPLETED_PROGRESS,
+        message=f"Completed: {total_events} events scraped ({total_ms}ms)",
+        events_count=total_events,
+        duration_ms=total_ms,
+    ))
+
+    outcome.total_events = total_events
+    outcome.failed_count = failed_count
+
+    # Determine final status
+    if failed_count > 0 and total_events > 0:
+        outcome.final_status = ScrapeStatus.PARTIAL
+    elif total_events == 0:
+        outcome.final_status = ScrapeStatus.FAILED
+
+
+# Coordinator event_type -> progress handler, looked up once per event
+_EVENT_HANDLERS: Final[
+    dict[str, Callable[[dict, CoalescingBroadcaster, _CycleOutcome], Awaitable[None]]]
+] = {
+    "CYCLE_START": _on_cycle_start,
+    "DISCOVERY_COMPLETE": _on_discovery_complete,
+    "BATCH_COMPLETE": _on_batch_complete,
+    "CYCLE_COMPLETE": _on_cycle_complete,
+}
+
+
+# Seconds a cached Settings row stays valid before re-reading from DB
+SETTINGS_CACHE_TTL_SECONDS = 60.0
+
+# Settings columns read through the cache (scheduler intervals, scrape filter,
+# EventCoordinator tuning, retention). Other columns are left unloaded.
+_JOB_SETTINGS_COLUMNS: Final = (
+    Settings.scrape_interval_minutes,
+    Settings.cleanup_frequency_hours,
+    Settings.enabled_platforms,
+    Settings.odds_retention_days,
+    Settings.match_retention_days,
+    Settings.batch_size,
+    Settings.betpawa_concurrency,
+    Settings.sportybet_concurrency,
+    Settings.bet9ja_concurrency,
+    Settings.bet9ja_delay_ms,
+    Settings.max_concurrent_events,
+)
+
+
+def _idle_event() -> asyncio.Event:
+    """Create an Event that starts set (no scrape running)."""
+    event = asyncio.Event()
+    event.set()
+    return event
+
+
+@dataclass
+class JobContext:
+    """Shared state for scheduled jobs.
+
+    Passed to jobs via scheduler job kwargs so each job reads state through
+    ctx instead of module globals.
+
+    Attributes:
+        app_state: FastAPI app.state (HTTP clients, OddsCache, write queue),
+            None until set_app_state() runs during lifespan startup.
+        scraping_idle: Set while no scrape runs; cleared for the duration
+            of a scrape. Cleanup waits on it to avoid deleting while the
+            scrape inserts.
+        settings_cache: (monotonic timestamp, Settings) pair, or None when
+            empty or invalidated.
+        sportybet_client: SportyBet wrapper over app_state's HTTP client.
+        betpawa_client: BetPawa wrapper over app_state's HTTP client.
+        bet9ja_client: Bet9ja wrapper over app_state's HTTP client.
+        discovery_service: Tournament discovery service (stateless).
+            The wrappers and service are built once in set_app_state() and
+            reused by every job tick; reset_clients() drops them.
+        odds_cache: app_state.odds_cache bound once by set_app_state(),
+            or None if the app has no cache.
+        write_queue: app_state.write_queue bound once by set_app_state(),
+            or None if the app has no write queue.
+        last_cleanup_at: Naive-UTC completion time of the last successful
+            cleanup, or None if none has run. Seeded once from the latest
+            completed cleanup_runs row so a restart does not force a run.
+        cleanup_seeded: Whether last_cleanup_at has been seeded from the DB.
+        cleanup_retry_at: Naive-UTC time before which no new cleanup is
+            launched, set on every launch so a cleanup that keeps failing
+            is retried after CLEANUP_RETRY_DELAY, not on every scrape tick.
+        cleanup_task: Background cleanup launched by the scrape job, kept
+            referenced so it is not garbage-collected mid-run.
+    """
+
+    app_state: Any = None
+    scraping_idle: asyncio.Event = field(default_factory=_idle_event)
+    settings_cache: tuple[float, Settings | None] | None = None
+    sportybet_client: SportyBetClient | None = None
+    betpawa_client: BetPawaClient | None = None
+    bet9ja_client: Bet9jaClient | None = None
+    discovery_service: TournamentDiscoveryService | None = None
+    odds_cache: Any = None
+    write_queue: Any = None
+    last_cleanup_at: datetime | None = None
+    cleanup_seeded: bool = False
+    cleanup_retry_at: datetime | None = None
+    cleanup_task: asyncio.Task[None] | None = None
+
+
+# Process-wide job context, registered with the scheduler jobs
+job_context = JobContext()
+
+# Max seconds cleanup waits for an in-progress scrape before skipping
+CLEANUP_SCRAPE_WAIT_SECONDS = 300.0
+
+# Cleanup frequency used when no Settings row exists
+DEFAULT_CLEANUP_FREQUENCY_HOURS = 24
+
+# Minimum gap between cleanup launches when the last one did not succeed
+CLEANUP_RETRY_DELAY = timedelta(hours=1)
+
+
+@contextmanager
+def _scraping_active(ctx: JobContext) -> Iterator[None]:
+    """Clear ctx.scraping_idle for the duration of a scrape.
+
+    Args:
+        ctx: Job context whose idle event is toggled.
+    """
+    ctx.scraping_idle.clear()
+    try:
+        yield
+    finally:
+        ctx.scraping_idle.set()
+
 
-# Scraping activity tracking for coordination with cleanup
-_scraping_active: bool = False
+async def _get_settings(
+    ctx: JobContext, db: AsyncSession | None = None
+) -> Settings | None:
+    """Return the singleton Settings row, served from cache when fresh.
+
+    Falls back to a DB query on miss or expiry. The returned instance stays
+    usable after its session closes because the session factory uses
+    expire_on_commit=False.
+
+    Args:
+        ctx: Job context holding the settings cache.
+        db: Async database session used on cache miss. A short-lived session
+            is opened when omitted.
+
+    Returns:
+        Settings object or None if the row does not exist.
+    """
+    now = time.monotonic()
+    cached = ctx.settings_cache
+    if cached is not None and now - cached[0] < SETTINGS_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    # Primary-key get: served from the session identity map when present
+    options = [load_only(*_JOB_SETTINGS_COLUMNS)]
+    if db is None:
+        async with async_session_factory() as session:
+            settings = await session.get(Settings, 1, options=options)
+    else:
+        settings = await db.get(Settings, 1, options=options)
+    ctx.settings_cache = (now, settings)
+    return settings
+
+
+async def get_cached_settings() -> Settings | None:
+    """Return the cached Settings row for callers outside the jobs.
+
+    Shares the job cache, so startup sync and the first scrape tick need
+    only one query between them.
+
+    Returns:
+        Settings object or None if the row does not exist.
+    """
+    return await _get_settings(job_context)
+
+
+def invalidate_settings_cache() -> None:
+    """Drop the cached Settings row so the next job tick re-reads it."""
+    job_context.settings_cache = None
 
 
 def is_scraping_active() -> bool:
@@ -61,245 +404,394 @@ def is_scraping_active() -> bool:
     Returns:
         True if a scraping job is currently running.
     """
-    return _scraping_active
+    return not job_context.scraping_idle.is_set()
+
+
+def _build_clients(ctx: JobContext) -> None:
+    """Wrap ctx.app_state's HTTP clients and bind its cache and write queue.
+
+    Args:
+        ctx: Job context whose app_state holds the httpx clients.
+    """
+    app_state = ctx.app_state
+    ctx.sportybet_client = SportyBetClient(app_state.sportybet_client)
+    ctx.betpawa_client = BetPawaClient(app_state.betpawa_client)
+    ctx.bet9ja_client = Bet9jaClient(app_state.bet9ja_client)
+    ctx.discovery_service = TournamentDiscoveryService()
+    ctx.odds_cache = getattr(app_state, "odds_cache", None)
+    ctx.write_queue = getattr(app_state, "write_queue", None)
 
 
 def set_app_state(state: Any) -> None:
     """Set the app state reference for job access to HTTP clients.
 
+    Also builds the platform client wrappers once and binds the odds cache
+    and write queue, so job ticks reuse them. Call after those are on state.
+
+    Args:
+        state: FastAPI app.state object containing HTTP clients, OddsCache,
+            and AsyncWriteQueue.
+    """
+    job_context.app_state = state
+    _build_clients(job_context)
+
+
+def reset_clients(ctx: JobContext = job_context) -> None:
+    """Drop the cached platform clients.
+
+    The next scrape rebuilds them from ctx.app_state. Call this after the
+    underlying httpx clients are replaced or closed.
+
+    Args:
+        ctx: Job context to reset (defaults to the process-wide job_context).
+    """
+    ctx.sportybet_client = None
+    ctx.betpawa_client = None
+    ctx.bet9ja_client = None
+    ctx.discovery_service = None
+    ctx.odds_cache = None
+    ctx.write_queue = None
+
+
+async def cancel_cleanup(ctx: JobContext = job_context) -> None:
+    """Cancel a background cleanup launched by the scrape job, if running.
+
+    Deletes not yet committed are rolled back with the session; the
+    CleanupRun row of an interrupted run stays "running".
+
+    Args:
+        ctx: Job context holding the cleanup task (defaults to job_context).
+    """
+    task = ctx.cleanup_task
+    ctx.cleanup_task = None
+    if task is None or task.done():
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+async def _seed_last_cleanup(ctx: JobContext) -> None:
+    """Seed ctx.last_cleanup_at from the latest completed cleanup run.
+
+    Queried once per process, so the first scrape after a restart does not
+    trigger a cleanup that ran shortly before it.
+
+    Args:
+        ctx: Job context tracking the last cleanup.
+    """
+    async with async_session_factory() as session:
+        completed_at = await session.scalar(
+            select(func.max(CleanupRun.completed_at)).where(
+                CleanupRun.status == "completed"
+            )
+        )
+    if ctx.last_cleanup_at is None:
+        ctx.last_cleanup_at = completed_at
+    ctx.cleanup_seeded = True
+
+
+async def _maybe_launch_cleanup(ctx: JobContext) -> None:
+    """Launch cleanup_old_data() in the background when it is due.
+
+    Cleanup is due when no cleanup has ever completed, or when
+    cleanup_frequency_hours have elapsed since the last success. A launch
+    that fails (or is skipped) backs off for CLEANUP_RETRY_DELAY before the
+    next attempt. It runs as a task so the scrape job completes without
+    waiting on it. Errors are logged so they never mask the scrape job's
+    own outcome.
+
+    Args:
+        ctx: Job context tracking the last cleanup and the running task.
+    """
+    if ctx.cleanup_task is not None and not ctx.cleanup_task.done():
+        return
+
+    try:
+        if not ctx.cleanup_seeded:
+            await _seed_last_cleanup(ctx)
+        settings = await _get_settings(ctx)
+    except Exception as e:
+        logger.warning("Cleanup scheduling check failed: %s", e)
+        return
+
+    hours = (
+        settings.cleanup_frequency_hours
+        if settings is not None
+        else DEFAULT_CLEANUP_FREQUENCY_HOURS
+    )
+    now = utcnow()
+    last = ctx.last_cleanup_at
+    if last is not None and now - last < timedelta(hours=hours):
+        return
+    retry_at = ctx.cleanup_retry_at
+    if retry_at is not None and now < retry_at:
+        return
+
+    # Recorded before launching, so a failed attempt is not retried per tick
+    ctx.cleanup_retry_at = now + min(CLEANUP_RETRY_DELAY, timedelta(hours=hours))
+    ctx.cleanup_task = asyncio.create_task(cleanup_old_data(ctx))
+
+
+async def _discover_tournaments(
+    discovery_service: TournamentDiscoveryService,
+    sportybet_client: SportyBetClient,
+    bet9ja_client: Bet9jaClient,
+) -> None:
+    """Run tournament discovery on a dedicated session.
+
+    Errors propagate to the caller, which marks the ScrapeRun FAILED.
+
     Args:
-        state: FastAPI app.state object containing HTTP clients.
+        discovery_service: Tournament discovery service.
+        sportybet_client: SportyBet API client.
+        bet9ja_client: Bet9ja API client.
     """
-    global _app_state
-    _app_state = state
+    async with async_session_factory() as session:
+        discovery_results = await discovery_service.discover_all(
+            sportybet_client, bet9ja_client, session
+        )
 
+    logger.info(
+        "Tournament discovery: sportybet new=%d, bet9ja new=%d",
+        discovery_results["sportybet"]["new"],
+        discovery_results["bet9ja"]["new"],
+    )
 
-async def scrape_all_platforms() -> None:
+
+async def scrape_all_platforms(ctx: JobContext = job_context) -> None:
     """Scheduled job to scrape all platforms.
 
-    Creates a ScrapeRun record, executes scraping via orchestrator with
+    Creates a ScrapeRun record, executes scraping via EventCoordinator with
     progress streaming, and updates the record with results or failure status.
 
     Progress is published to a broadcaster so UI can observe via SSE.
     Respects enabled_platforms from settings to filter which platforms to scrape.
+    Retention cleanup is launched afterwards on every exit (skipped scrapes
+    and failures included) unless the job itself is being cancelled.
+
+    Args:
+        ctx: Job context (defaults to the process-wide job_context).
+    """
+    try:
+        await _scrape_all_platforms(ctx)
+    finally:
+        task = asyncio.current_task()
+        if task is None or not task.cancelling():
+            await _maybe_launch_cleanup(ctx)
+
+
+async def _scrape_all_platforms(ctx: JobContext) -> None:
+    """Run one scrape; see scrape_all_platforms().
+
+    Args:
+        ctx: Job context.
     """
-    global _scraping_active
     logger.info("Starting scheduled scrape job")
 
-    if _app_state is None:
+    app_state = ctx.app_state
+    if app_state is None:
         logger.error("App state not initialized - cannot run scheduled scrape")
         return
 
-    async with async_session_factory() as db:
-        # Fetch settings to get enabled platforms
-        result = await db.execute(select(Settings).where(Settings.id == 1))
-        settings = result.scalar_one_or_none()
-
-        # Determine which platforms to scrape
-        enabled_platforms: list[Platform] | None = None
-        if settings and settings.enabled_platforms:
-            # Map slug strings to Platform enum values
-            slug_to_platform = {
-                "sportybet": Platform.SPORTYBET,
-                "betpawa": Platform.BETPAWA,
-                "bet9ja": Platform.BET9JA,
-            }
-            enabled_platforms = [
-                slug_to_platform[slug]
-                for slug in settings.enabled_platforms
-                if slug in slug_to_platform
-            ]
-            logger.info(f"Enabled platforms from settings: {[p.value for p in enabled_platforms]}")
-
-            if not enabled_platforms:
-                logger.warning("No platforms enabled in settings - skipping scrape")
-                return
-
-        # Create ScrapeRun record
-        scrape_run = ScrapeRun(
-            status=ScrapeStatus.RUNNING,
-            trigger="scheduled",
+    # Fetch settings to get enabled platforms. Served from the cache (a
+    # short-lived session only on a miss), so a disabled scrape returns
+    # before the work session checks out a pooled connection.
+    settings = await _get_settings(ctx)
+
+    # Determine which platforms to scrape
+    enabled_platforms: list[Platform] | None = None
+    if settings and settings.enabled_platforms:
+        # Map slug strings to Platform enum values, dropping unknown slugs
+        enabled_platforms = [
+            p
+            for slug in settings.enabled_platforms
+            if (p := _SLUG_TO_PLATFORM.get(slug)) is not None
+        ]
+        logger.info(
+            "Enabled platforms from settings: %s", [p.value for p in enabled_platforms]
         )
-        db.add(scrape_run)
-        await db.commit()
-        await db.refresh(scrape_run)
-        scrape_run_id = scrape_run.id
 
-        logger.info(f"Created ScrapeRun {scrape_run_id}")
+        if not enabled_platforms:
+            logger.warning("No platforms enabled in settings - skipping scrape")
+            return
 
-        # Create broadcaster for this scrape run
-        broadcaster = progress_registry.create_broadcaster(scrape_run_id)
+    # Reuse the client wrappers built in set_app_state()
+    if ctx.discovery_service is None:
+        _build_clients(ctx)
+    sportybet_client = ctx.sportybet_client
+    betpawa_client = ctx.betpawa_client
+    bet9ja_client = ctx.bet9ja_client
 
-        # Mark scraping as active
-        _scraping_active = True
-
-        try:
-            # Create clients from app state
-            sportybet_client = SportyBetClient(_app_state.sportybet_client)
-            betpawa_client = BetPawaClient(_app_state.betpawa_client)
-            bet9ja_client = Bet9jaClient(_app_state.bet9ja_client)
-
-            # Run tournament discovery to pick up any new tournaments
-            discovery_service = TournamentDiscoveryService()
-            discovery_results = await discovery_service.discover_all(
-                sportybet_client, bet9ja_client, db
-            )
-            logger.info(
-                f"Tournament discovery: sportybet new={discovery_results['sportybet']['new']}, "
-                f"bet9ja new={discovery_results['bet9ja']['new']}"
-            )
-
-            # Create EventCoordinator from settings (with optional cache and write queue)
-            coordinator = EventCoordinator.from_settings(
-                betpawa_client=betpawa_client,
-                sportybet_client=sportybet_client,
-                bet9ja_client=bet9ja_client,
-                settings=settings,
-                odds_cache=getattr(_app_state, "odds_cache", None),
-                write_queue=getattr(_app_state, "write_queue", None),
-            )
-
-            # Execute scrape with progress streaming
-            platform_timings: dict[str, dict] = {}
-            total_events = 0
-            failed_count = 0
-            final_status = ScrapeStatus.COMPLETED
-
-            async for progress_event in coordinator.run_full_cycle(
-                db=db,
-                scrape_run_id=scrape_run_id,
-            ):
-                # Convert dict events to ScrapeProgress for broadcaster compatibility
-                event_type = progress_event.get("event_type", "")
-
-                if event_type == "CYCLE_START":
-                    await broadcaster.publish(ScrapeProgress(
-                        platform=None,
-                        phase="starting",
-                        current=0,
-                        total=3,
-                        message="Starting event-centric scrape cycle",
-                    ))
-                elif event_type == "DISCOVERY_COMPLETE":
-                    total = progress_event.get("total_events", 0)
-                    await broadcaster.publish(ScrapeProgress(
-                        platform=None,
-                        phase="discovery",
-                        current=1,
-                        total=3,
-                        message=f"Discovered {total} events across all platforms",
-                        events_count=total,
-                    ))
-                elif event_type == "BATCH_COMPLETE":
-                    processed = progress_event.get("events_stored", 0)
-                    await broadcaster.publish(ScrapeProgress(
-                        platform=None,
-                        phase="scraping",
-                        current=2,
-                        total=3,
-                        message=f"Processed batch: {processed} events stored",
-                        events_count=processed,
-                    ))
-                elif event_type == "CYCLE_COMPLETE":
-                    total_events = progress_event.get("events_scraped", 0)
-                    failed_count = progress_event.get("events_failed", 0)
-                    total_ms = progress_event.get("total_timing_ms", 0)
-
-                    await broadcaster.publish(ScrapeProgress(
-                        platform=None,
-                        phase="completed",
-                        current=3,
-                        total=3,
-                        message=f"Completed: {total_events} events scraped ({total_ms}ms)",
-                        events_count=total_events,
-                        duration_ms=total_ms,
-                    ))
-
-                    # Determine final status
-                    if failed_count > 0 and total_events > 0:
-                        final_status = ScrapeStatus.PARTIAL
-                    elif total_events == 0:
-                        final_status = ScrapeStatus.FAILED
-
-            scrape_run.status = final_status
-            scrape_run.events_scraped = total_events
-            scrape_run.events_failed = failed_count
-            scrape_run.platform_timings = platform_timings if platform_timings else None
-            scrape_run.completed_at = datetime.utcnow()
-
-            await db.commit()
-
-            logger.info(
-                f"Completed ScrapeRun {scrape_run_id}: "
-                f"status={scrape_run.status.value}, events={total_events}"
+    async with async_session_factory() as db:
+        # Mark scraping active for the whole run so cleanup can wait for it
+        with _scraping_active(ctx):
+            # Tournament discovery runs on its own session, overlapping the
+            # ScrapeRun INSERT (INSERT ... RETURNING, no ORM instance kept).
+            # It is awaited inside the try below, so a failure marks the run
+            # FAILED like any other scrape error.
+            discovery = asyncio.create_task(
+                _discover_tournaments(
+                    ctx.discovery_service, sportybet_client, bet9ja_client
+                )
             )
+            try:
+                result = await db.execute(
+                    insert(ScrapeRun)
+                    .values(status=ScrapeStatus.RUNNING, trigger="scheduled")
+                    .returning(ScrapeRun.id)
+                )
+                scrape_run_id = result.scalar_one()
+                await db.commit()
+            except BaseException:
+                discovery.cancel()
+                raise
+
+            logger.info("Created ScrapeRun %d", scrape_run_id)
+
+            # Create broadcaster for this scrape run. Progress goes through a
+            # coalescing publisher so BATCH_COMPLETE bursts collapse per window.
+            broadcaster = progress_registry.create_broadcaster(scrape_run_id)
+            publisher = CoalescingBroadcaster(broadcaster)
+
+            try:
+                await discovery
+
+                # Create EventCoordinator from settings (with optional cache and write queue)
+                coordinator = EventCoordinator.from_settings(
+                    betpawa_client=betpawa_client,
+                    sportybet_client=sportybet_client,
+                    bet9ja_client=bet9ja_client,
+                    settings=settings,
+                    odds_cache=ctx.odds_cache,
+                    write_queue=ctx.write_queue,
+                )
 
-            # Evict expired events from cache (2 hours past kickoff grace period)
-            odds_cache = getattr(_app_state, "odds_cache", None)
-            if odds_cache:
-                cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=2)
-                evicted = odds_cache.evict_expired(cutoff)
-                if evicted > 0:
-                    logger.info(
-                        f"Cache eviction: {evicted} events removed, "
-                        f"stats={odds_cache.stats()}"
+                # Execute scrape with progress streaming
+                outcome = _CycleOutcome()
+
+                async for progress_event in coordinator.run_full_cycle(
+                    db=db,
+                    scrape_run_id=scrape_run_id,
+                ):
+                    # Convert dict events to ScrapeProgress for broadcaster compatibility.
+                    # Per-event path: the only datetime built here is the progress
+                    # timestamp in _progress_from(); completed_at and the cache
+                    # eviction cutoff share one utcnow() after the loop.
+                    handler = _EVENT_HANDLERS.get(progress_event.get("event_type"))
+                    if handler is not None:
+                        await handler(progress_event, publisher, outcome)
+
+                total_events = outcome.total_events
+                failed_count = outcome.failed_count
+                final_status = outcome.final_status
+
+                # Single timestamp for completed_at and the cache eviction cutoff
+                now = utcnow()
+
+                await db.execute(
+                    update(ScrapeRun)
+                    .where(ScrapeRun.id == scrape_run_id)
+                    .execution_options(synchronize_session=False)
+                    .values(
+                        status=final_status,
+                        events_scraped=total_events,
+                        events_failed=failed_count,
+                        platform_timings=None,  # EventCoordinator doesn't track platform-level timings
+                        completed_at=now,
                     )
+                )
+                await db.commit()
 
-            # Log write queue stats after scrape cycle
-            write_queue = getattr(_app_state, "write_queue", None)
-            if write_queue:
-                stats = write_queue.stats()
                 logger.info(
-                    f"Write queue post-scrape: "
-                    f"queue_size={stats['queue_size']}, "
-                    f"queue_maxsize={stats['queue_maxsize']}, "
-                    f"running={stats['running']}"
+                    "Completed ScrapeRun %d: status=%s, events=%d",
+                    scrape_run_id,
+                    final_status.value,
+                    total_events,
                 )
 
-        except Exception as e:
-            logger.exception(f"ScrapeRun {scrape_run_id} failed: {e}")
-
-            # Publish failure to broadcaster (uses module-level ScrapeProgress import)
-            await broadcaster.publish(ScrapeProgress(
-                platform=None,
-                phase="failed",
-                current=0,
-                total=3,
-                message=f"Scrape failed: {str(e)}",
-            ))
+                # Evict expired events from cache (2 hours past kickoff grace period)
+                odds_cache = ctx.odds_cache
+                if odds_cache:
+                    evicted = odds_cache.evict_expired(now - timedelta(hours=2))
+                    if evicted > 0:
+                        logger.info(
+                            "Cache eviction: %d events removed, stats=%s",
+                            evicted,
+                            odds_cache.stats(),
+                        )
+
+                # Log write queue stats after scrape cycle
+                write_queue = ctx.write_queue
+                if write_queue:
+                    stats = write_queue.stats()
+                    logger.info(
+                        "Write queue post-scrape: queue_size=%d, queue_maxsize=%d, running=%s",
+                        stats["queue_size"],
+                        stats["queue_maxsize"],
+                        stats["running"],
+                    )
 
-            # Update ScrapeRun to FAILED status
-            scrape_run.status = ScrapeStatus.FAILED
-            scrape_run.completed_at = datetime.utcnow()
-            await db.commit()
+            except Exception as e:
+                logger.exception("ScrapeRun %d failed: %s", scrape_run_id, e)
+
+                # Publish failure to broadcaster
+                await publisher.publish_coalesced(_progress_from(
+                    _FAILED_PROGRESS,
+                    message=f"Scrape failed: {str(e)}",
+                ))
+
+                # Rollback any pending transaction, then mark ScrapeRun FAILED
+                await db.rollback()
+                await db.execute(
+                    update(ScrapeRun)
+                    .where(ScrapeRun.id == scrape_run_id)
+                    .execution_options(synchronize_session=False)
+                    .values(
+                        status=ScrapeStatus.FAILED,
+                        completed_at=utcnow(),
+                    )
+                )
+                await db.commit()
 
-        finally:
-            # Mark scraping as inactive
-            _scraping_active = False
+            finally:
+                # Flush coalesced updates, close broadcaster and remove from registry
+                await publisher.flush()
+                await broadcaster.close()
+                progress_registry.remove_broadcaster(scrape_run_id)
 
-            # Close broadcaster and remove from registry
-            await broadcaster.close()
-            progress_registry.remove_broadcaster(scrape_run_id)
 
+async def cleanup_old_data(ctx: JobContext = job_context) -> None:
+    """Clean up old data based on retention settings.
 
-async def cleanup_old_data() -> None:
-    """Scheduled job to clean up old data based on retention settings.
+    Launched by scrape_all_platforms() when cleanup is due; records the
+    completion time in ctx.last_cleanup_at on success. If scraping is in
+    progress, waits up to CLEANUP_SCRAPE_WAIT_SECONDS for it to finish and
+    skips only if it is still running. Uses settings from database for
+    retention periods. Records cleanup run in cleanup_runs table.
 
-    Checks if scraping is in progress and skips if so to avoid conflicts.
-    Uses settings from database for retention periods.
-    Records cleanup run in cleanup_runs table.
+    Args:
+        ctx: Job context (defaults to the process-wide job_context).
     """
     logger.info("Starting scheduled cleanup job")
 
-    # Skip if scraping is in progress
-    if is_scraping_active():
-        logger.info("Cleanup skipped - scraping is in progress")
-        return
+    # Wait for an in-progress scrape to finish. Checked before opening a
+    # session so skipped ticks never check out a pooled connection.
+    if not ctx.scraping_idle.is_set():
+        logger.info("Cleanup waiting - scraping is in progress")
+        try:
+            await asyncio.wait_for(
+                ctx.scraping_idle.wait(), timeout=CLEANUP_SCRAPE_WAIT_SECONDS
+            )
+        except TimeoutError:
+            logger.info("Cleanup skipped - scraping is still in progress")
+            return
 
     async with async_session_factory() as session:
         # Get current retention settings
-        result = await session.execute(select(Settings).where(Settings.id == 1))
-        settings = result.scalar_one_or_none()
+        settings = await _get_settings(ctx, session)
 
         if settings is None:
             logger.warning("No settings found - using default retention (30 days)")
@@ -309,64 +801,80 @@ async def cleanup_old_data() -> None:
             odds_days = settings.odds_retention_days
             match_days = settings.match_retention_days
 
-        # Execute cleanup with tracking
+        # Execute cleanup with tracking, cutoffs derived from a single naive-UTC now
         from src.services.cleanup import execute_cleanup_with_tracking
 
+        now = utcnow()
+
         try:
             cleanup_run, result = await execute_cleanup_with_tracking(
                 session=session,
                 odds_days=odds_days,
                 match_days=match_days,
                 trigger="scheduled",
+                odds_cutoff=now - timedelta(days=odds_days),
+                match_cutoff=now - timedelta(days=match_days),
             )
 
             logger.info(
-                f"Cleanup completed: cleanup_run_id={cleanup_run.id}, "
-                f"odds_deleted={result.odds_deleted}, "
-                f"events_deleted={result.events_deleted}, "
-                f"tournaments_deleted={result.tournaments_deleted}, "
-                f"duration={result.duration_seconds}s"
+                "Cleanup completed: cleanup_run_id=%d, odds_deleted=%d, "
+                "events_deleted=%d, tournaments_deleted=%d, duration=%ss",
+                cleanup_run.id,
+                result.odds_deleted,
+                result.events_deleted,
+                result.tournaments_deleted,
+                result.duration_seconds,
             )
+            ctx.last_cleanup_at = utcnow()
         except Exception as e:
-            logger.exception(f"Cleanup failed: {e}")
+            logger.exception("Cleanup failed: %s", e)
 
 
-async def sample_storage_sizes() -> None:
+async def sample_storage_sizes(exact: bool | None = None) -> None:
     """Scheduled job to sample database storage sizes.
 
     Queries PostgreSQL system tables for current storage sizes,
     creates a StorageSample record, checks for abnormal growth,
     and prunes old samples and resolved alerts.
-    Runs daily at 3 AM UTC (after cleanup at 2 AM).
+    Runs every 24 hours, counted from scheduler start.
+
+    Per-table sizes come from pg_class page counts by default, which avoids
+    opening every relation. The exact pg_total_relation_size() query runs
+    once a week. Both cover heap, indexes and TOAST for the same tables, so
+    the table_sizes history stays comparable. The total database size is
+    always exact.
+
+    Args:
+        exact: Force exact (True) or approximate (False) per-table sizes.
+            None uses exact sizes on EXACT_SIZES_WEEKDAY only.
     """
-    log = structlog.get_logger("src.scheduling.jobs.storage")
-    log.info("storage.sampling.start")
+    log = storage_log
+    if exact is None:
+        exact = datetime.now(UTC).weekday() == EXACT_SIZES_WEEKDAY
+    log.info("storage.sampling.start", exact=exact)
 
     # Growth alert thresholds
     GROWTH_WARNING_PERCENT = 20  # 20% growth in 24h triggers warning
     SIZE_CRITICAL_BYTES = 50 * 1024**3  # 50 GB triggers critical alert
 
     try:
-        async with async_session_factory() as session:
-            # Query table sizes from pg_stat_user_tables
-            table_sizes_query = text("""
-                SELECT
-                    relname as table_name,
-                    pg_total_relation_size(quote_ident(relname)) as size_bytes
-                FROM pg_stat_user_tables
-            """)
-            result = await session.execute(table_sizes_query)
-            rows = result.fetchall()
-
-            table_sizes_dict = {row.table_name: row.size_bytes for row in rows}
-
-            # Query total database size
-            total_size_query = text("""
-                SELECT pg_database_size(current_database()) as total_bytes
-            """)
-            total_result = await session.execute(total_size_query)
-            total_row = total_result.fetchone()
-            total_bytes = total_row.total_bytes
+        # Single transaction: sample insert, alerts and pruning share one commit
+        async with async_session_factory() as session, session.begin():
+            # Query per-table sizes and total database size in one round-trip
+            sizes_query = _EXACT_SIZES_QUERY if exact else _APPROX_SIZES_QUERY
+            result = await session.execute(sizes_query)
+            row = result.one()
+
+            table_sizes_dict = row.table_sizes
+            total_bytes = row.total_bytes
+
+            # Latest existing sample, read before inserting the new one
+            prev_result = await session.execute(
+                select(StorageSample)
+                .order_by(StorageSample.sampled_at.desc())
+                .limit(1)
+            )
+            prev_sample = prev_result.scalar_one_or_none()
 
             # Create StorageSample record
             sample = StorageSample(
@@ -374,8 +882,8 @@ async def sample_storage_sizes() -> None:
                 table_sizes=table_sizes_dict,
             )
             session.add(sample)
-            await session.commit()
-            await session.refresh(sample)
+            # Flush (not commit) to get sample.id from INSERT ... RETURNING
+            await session.flush()
 
             log.info(
                 "storage.sampling.recorded",
@@ -384,15 +892,7 @@ async def sample_storage_sizes() -> None:
                 table_count=len(table_sizes_dict),
             )
 
-            # Check for growth alerts - query previous sample
-            prev_result = await session.execute(
-                select(StorageSample)
-                .where(StorageSample.id < sample.id)
-                .order_by(StorageSample.sampled_at.desc())
-                .limit(1)
-            )
-            prev_sample = prev_result.scalar_one_or_none()
-
+            # Check for growth alerts against the previous sample
             if prev_sample and prev_sample.total_bytes > 0:
                 # Calculate growth percentage
                 growth_bytes = total_bytes - prev_sample.total_bytes
@@ -408,7 +908,7 @@ async def sample_storage_sizes() -> None:
                         growth_percent=growth_percent,
                     )
                     session.add(alert)
-                    await session.commit()
+                    await session.flush()
 
                     log.warning(
                         "storage.alert.growth_warning",
@@ -436,7 +936,7 @@ async def sample_storage_sizes() -> None:
                         growth_percent=0,
                     )
                     session.add(alert)
-                    await session.commit()
+                    await session.flush()
 
                     log.warning(
                         "storage.alert.size_critical",
@@ -445,20 +945,15 @@ async def sample_storage_sizes() -> None:
                     )
 
             # Prune old samples (keep last 90)
-            subquery = (
-                select(StorageSample.sampled_at)
-                .order_by(StorageSample.sampled_at.desc())
-                .offset(90)
-                .limit(1)
-                .scalar_subquery()
-            )
-
-            delete_stmt = delete(StorageSample).where(
-                StorageSample.sampled_at < subquery
-            )
-            delete_result = await session.execute(delete_stmt)
+            delete_result = await session.execute(text("""
+                WITH ranked AS (
+                    SELECT id, row_number() OVER (ORDER BY sampled_at DESC) AS rn
+                    FROM storage_samples
+                )
+                DELETE FROM storage_samples
+                WHERE id IN (SELECT id FROM ranked WHERE rn > 90)
+            """))
             deleted_count = delete_result.rowcount
-            await session.commit()
 
             if deleted_count > 0:
                 log.info(
@@ -467,22 +962,16 @@ async def sample_storage_sizes() -> None:
                 )
 
             # Prune old resolved alerts (keep last 30)
-            alert_subquery = (
-                select(StorageAlert.created_at)
-                .where(StorageAlert.resolved_at.is_not(None))
-                .order_by(StorageAlert.created_at.desc())
-                .offset(30)
-                .limit(1)
-                .scalar_subquery()
-            )
-
-            alert_delete_stmt = delete(StorageAlert).where(
-                StorageAlert.resolved_at.is_not(None),
-                StorageAlert.created_at < alert_subquery,
-            )
-            alert_delete_result = await session.execute(alert_delete_stmt)
+            alert_delete_result = await session.execute(text("""
+                WITH ranked AS (
+                    SELECT id, row_number() OVER (ORDER BY created_at DESC) AS rn
+                    FROM storage_alerts
+                    WHERE resolved_at IS NOT NULL
+                )
+                DELETE FROM storage_alerts
+                WHERE id IN (SELECT id FROM ranked WHERE rn > 30)
+            """))
             alerts_deleted = alert_delete_result.rowcount
-            await session.commit()
 
             if alerts_deleted > 0:
                 log.info(
@@ -498,10 +987,6 @@ def _format_bytes(bytes_value: int) -> str:
     """Format bytes to human-readable string."""
     if bytes_value == 0:
         return "0 B"
-    units = ["B", "KB", "MB", "GB", "TB"]
-    k = 1024
-    i = 0
-    while bytes_value >= k and i < len(units) - 1:
-        bytes_value /= k
-        i += 1
-    return f"{bytes_value:.2f} {units[i]}"
+    # Each unit step is 2**10, so bit_length picks the unit without a loop
+    i = min((bytes_value.bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{bytes_value / (1 << (i * 10)):.2f} {_BYTE_UNITS[i]}"
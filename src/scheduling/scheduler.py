@@ -1,27 +1,38 @@
-"""APScheduler configuration and lifecycle management.
+"""Periodic job scheduler configuration and lifecycle management.
 
 Provides the global scheduler instance and lifecycle functions for
 managing periodic background jobs in the application.
 
 Scheduler Instance:
-    Module-level AsyncIOScheduler with UTC timezone. Access via:
+    Module-level PeriodicRunner: a single asyncio driver task that keeps
+    next-run times in a heap, sleeps until the earliest one, and launches
+    the job coroutine as a task. Access via:
     from src.scheduling.scheduler import scheduler
 
+    Deadlines advance by whole intervals from the previous deadline, so
+    runs do not drift. A job whose previous run is still in progress is
+    skipped for that tick (at most one instance per job), and missed ticks
+    are coalesced into a single run.
+
 Jobs Configured:
     - scrape_all_platforms: Interval trigger (default 5 min)
     - detect_stale_runs: Every 2 minutes (watchdog for stuck runs)
-    - cleanup_old_data: Interval trigger (default 24 hours)
+    - sample_storage_sizes: Every 24 hours
+
+    Retention cleanup is not a scheduler job: scrape_all_platforms launches
+    cleanup_old_data once cleanup_frequency_hours have elapsed, reading the
+    frequency from settings on each tick.
 
 Lifecycle:
     configure_scheduler(): Add jobs with default intervals
     start_scheduler(): Begin job execution
     shutdown_scheduler(): Graceful stop with optional wait
-    sync_settings_on_startup(): Load intervals from database Settings
+    sync_settings_on_startup(): Load scrape interval from SCRAPE_INTERVAL_MINUTES
+        or, when unset, from database Settings
 
 Runtime Updates:
     update_scheduler_interval(): Change scrape job interval
-    update_cleanup_interval(): Change cleanup job interval
-    Both reschedule existing jobs without restart.
+    Reschedules the existing job without restart.
 
 Usage:
     # In FastAPI lifespan
@@ -29,96 +40,309 @@ Usage:
     start_scheduler()
     await sync_settings_on_startup()  # After DB is available
     yield
-    shutdown_scheduler()
+    await shutdown_scheduler()
 """
 
+import asyncio
+import heapq
 import logging
-
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.interval import IntervalTrigger
+import os
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any
 
 from src.db.models.settings import Settings
 
 logger = logging.getLogger(__name__)
 
-# Module-level scheduler instance with UTC timezone
-scheduler = AsyncIOScheduler(timezone="UTC")
+
+class JobLookupError(KeyError):
+    """Raised when a job id is not registered with the scheduler."""
+
+
+@dataclass
+class PeriodicJob:
+    """A coroutine function run at a fixed interval.
+
+    Attributes:
+        id: Unique job identifier.
+        func: Coroutine function to call on each run.
+        interval_seconds: Seconds between runs.
+        kwargs: Keyword arguments passed to func.
+        next_run_at: time.monotonic() deadline of the next run.
+        task: Task of the current run, or None if it has not run yet.
+    """
+
+    id: str
+    func: Callable[..., Awaitable[Any]]
+    interval_seconds: float
+    kwargs: dict[str, Any] = field(default_factory=dict)
+    next_run_at: float = 0.0
+    task: asyncio.Task[Any] | None = None
+
+    @property
+    def next_run_time(self) -> datetime:
+        """Wall-clock (UTC) time of the next run."""
+        delay = self.next_run_at - time.monotonic()
+        return datetime.now(timezone.utc) + timedelta(seconds=max(delay, 0.0))
+
+
+def _interval_seconds(interval: timedelta) -> float:
+    """Convert a job interval to seconds, rejecting non-positive values."""
+    interval_seconds = interval.total_seconds()
+    if interval_seconds <= 0:
+        raise ValueError(f"Job interval must be positive, got {interval}")
+    return interval_seconds
+
+
+class PeriodicRunner:
+    """Minimal interval scheduler driven by one asyncio task.
+
+    Heap entries are (next_run_at, seq, job_id). Rescheduling pushes a new
+    entry and stale ones are dropped when popped, so no heap rebuild is
+    needed.
+    """
+
+    def __init__(self) -> None:
+        self._jobs: dict[str, PeriodicJob] = {}
+        self._heap: list[tuple[float, int, str]] = []
+        self._seq = 0
+        self._wakeup = asyncio.Event()
+        self._driver: asyncio.Task[None] | None = None
+        self._running_tasks: set[asyncio.Task[Any]] = set()
+        self.paused = False
+
+    @property
+    def running(self) -> bool:
+        """Whether the driver task is running."""
+        return self._driver is not None and not self._driver.done()
+
+    def _push(self, job: PeriodicJob) -> None:
+        """Queue job at its next_run_at and wake the driver."""
+        self._seq += 1
+        heapq.heappush(self._heap, (job.next_run_at, self._seq, job.id))
+        self._wakeup.set()
+
+    def add_job(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        interval: timedelta,
+        id: str,
+        kwargs: dict[str, Any] | None = None,
+    ) -> None:
+        """Register (or replace) a job; its first run is one interval away.
+
+        Args:
+            func: Coroutine function to call.
+            interval: Time between runs.
+            id: Unique job identifier.
+            kwargs: Keyword arguments passed to func.
+
+        Raises:
+            ValueError: If interval is not positive.
+        """
+        interval_seconds = _interval_seconds(interval)
+        job = PeriodicJob(
+            id=id,
+            func=func,
+            interval_seconds=interval_seconds,
+            kwargs=kwargs or {},
+            next_run_at=time.monotonic() + interval_seconds,
+        )
+        self._jobs[id] = job
+        self._push(job)
+
+    def get_jobs(self) -> list[PeriodicJob]:
+        """Return all registered jobs."""
+        return list(self._jobs.values())
+
+    def reschedule_job(self, job_id: str, interval: timedelta) -> None:
+        """Change a job's interval; the next run is one new interval away.
+
+        A call with the job's current interval is a no-op and keeps the
+        existing deadline.
+
+        Args:
+            job_id: Job identifier.
+            interval: New time between runs.
+
+        Raises:
+            JobLookupError: If no job with this id is registered.
+            ValueError: If interval is not positive.
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise JobLookupError(job_id)
+        interval_seconds = _interval_seconds(interval)
+        if interval_seconds == job.interval_seconds:
+            return
+        job.interval_seconds = interval_seconds
+        job.next_run_at = time.monotonic() + job.interval_seconds
+        self._push(job)
+
+    def pause(self) -> None:
+        """Stop launching jobs; ticks keep advancing while paused."""
+        self.paused = True
+
+    def resume(self) -> None:
+        """Resume launching jobs at their next tick."""
+        self.paused = False
+
+    def _launch(self, job: PeriodicJob) -> None:
+        """Start a run of job unless its previous run is still in progress."""
+        if job.task is not None and not job.task.done():
+            logger.warning(
+                "Skipping run of job %s: previous run still in progress", job.id
+            )
+            return
+        job.task = asyncio.create_task(job.func(**job.kwargs))
+        self._running_tasks.add(job.task)
+        job.task.add_done_callback(self._on_job_done)
+
+    def _on_job_done(self, task: asyncio.Task[Any]) -> None:
+        """Forget a finished run and log any exception it raised."""
+        self._running_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Scheduled job raised", exc_info=task.exception())
+
+    async def _run(self) -> None:
+        """Driver loop: sleep until the earliest due job, launch, requeue."""
+        while True:
+            self._wakeup.clear()
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+
+            run_at, _, job_id = self._heap[0]
+            delay = run_at - time.monotonic()
+            if delay > 0:
+                # Woken early by add/reschedule: re-evaluate the heap head
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._heap)
+            job = self._jobs.get(job_id)
+            if job is None or job.next_run_at != run_at:
+                continue  # Stale entry left behind by reschedule or replace
+
+            if not self.paused:
+                self._launch(job)
+
+            # Advance from the scheduled time, not from now, so wake-up
+            # latency does not accumulate as drift. Missed ticks are
+            # coalesced by skipping to the first deadline still ahead.
+            interval = job.interval_seconds
+            next_run_at = run_at + interval
+            now = time.monotonic()
+            if next_run_at <= now:
+                next_run_at += ((now - next_run_at) // interval + 1) * interval
+            job.next_run_at = next_run_at
+            self._push(job)
+
+    def start(self) -> None:
+        """Spawn the driver task on the running event loop."""
+        self._driver = asyncio.create_task(self._run())
+        self._driver.add_done_callback(self._on_driver_done)
+
+    def _on_driver_done(self, task: asyncio.Task[None]) -> None:
+        """Log a driver crash; no job runs again until the runner restarts."""
+        if not task.cancelled() and task.exception() is not None:
+            logger.critical(
+                "Scheduler driver stopped; no further jobs will run",
+                exc_info=task.exception(),
+            )
+
+    async def shutdown(self, wait: bool = True) -> None:
+        """Stop the driver task.
+
+        Args:
+            wait: If True, await in-flight job runs; otherwise cancel them.
+        """
+        if self._driver is not None:
+            self._driver.cancel()
+            try:
+                await self._driver
+            except asyncio.CancelledError:
+                pass
+            self._driver = None
+
+        pending = list(self._running_tasks)
+        if not wait:
+            for task in pending:
+                task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+# Module-level scheduler instance
+scheduler = PeriodicRunner()
 
 # Default intervals used during startup before DB is available
 DEFAULT_INTERVAL_MINUTES = 5
-DEFAULT_CLEANUP_HOURS = 24
+
+# Accepted scrape interval range, matching SettingsUpdate validation
+MIN_INTERVAL_MINUTES = 1
+MAX_INTERVAL_MINUTES = 60
 
 
 async def get_settings_from_db() -> Settings | None:
-    """Fetch settings from database.
+    """Fetch settings through the shared job settings cache.
 
     Returns:
         Settings object or None if not found.
     """
-    from sqlalchemy import select
-
-    from src.db.engine import async_session_factory
+    # Deferred import to avoid circular dependency
+    from src.scheduling.jobs import get_cached_settings
 
     try:
-        async with async_session_factory() as session:
-            result = await session.execute(select(Settings).where(Settings.id == 1))
-            return result.scalar_one_or_none()
+        return await get_cached_settings()
     except Exception as e:
-        logger.warning(f"Failed to fetch settings from database: {e}")
+        logger.warning("Failed to fetch settings from database: %s", e)
         return None
 
 
 def configure_scheduler() -> None:
-    """Configure the scheduler with scraping, cleanup, and storage sampling jobs.
+    """Configure the scheduler with scraping, stale detection, and storage sampling jobs.
 
-    Adds the scrape_all_platforms, cleanup_old_data, and sample_storage_sizes jobs
+    Adds the scrape_all_platforms, detect_stale_runs, and sample_storage_sizes jobs
     with default intervals. Uses deferred import to avoid circular dependencies.
 
     Note: Uses default intervals on startup. Call sync_settings_on_startup()
     after DB is available to sync with stored settings.
     """
     # Deferred import to avoid circular dependency
-    from src.scheduling.jobs import cleanup_old_data, sample_storage_sizes, scrape_all_platforms
+    from src.scheduling.jobs import (
+        job_context,
+        sample_storage_sizes,
+        scrape_all_platforms,
+    )
     from src.scheduling.stale_detection import detect_stale_runs
 
     # Use default interval on startup - will be updated when settings are loaded
     scheduler.add_job(
         scrape_all_platforms,
-        trigger=IntervalTrigger(minutes=DEFAULT_INTERVAL_MINUTES),
+        interval=timedelta(minutes=DEFAULT_INTERVAL_MINUTES),
+        kwargs={"ctx": job_context},
         id="scrape_all_platforms",
-        replace_existing=True,
-        misfire_grace_time=60,
-        coalesce=True,
     )
 
     # Add stale run detection watchdog (every 2 minutes)
     scheduler.add_job(
         detect_stale_runs,
-        trigger=IntervalTrigger(minutes=2),
+        interval=timedelta(minutes=2),
         id="detect_stale_runs",
-        replace_existing=True,
-        misfire_grace_time=60,
-        coalesce=True,
-    )
-
-    # Add cleanup job with default 24-hour interval
-    scheduler.add_job(
-        cleanup_old_data,
-        trigger=IntervalTrigger(hours=DEFAULT_CLEANUP_HOURS),
-        id="cleanup_old_data",
-        replace_existing=True,
-        misfire_grace_time=3600,  # 1 hour grace for cleanup
-        coalesce=True,
     )
 
-    # Add storage sampling job (daily, runs after cleanup)
+    # Add storage sampling job (daily)
     scheduler.add_job(
         sample_storage_sizes,
-        trigger=IntervalTrigger(hours=24),
+        interval=timedelta(hours=24),
         id="sample_storage_sizes",
-        replace_existing=True,
-        misfire_grace_time=3600,  # 1 hour grace for sampling
-        coalesce=True,
     )
 
 
@@ -130,30 +354,15 @@ def update_scheduler_interval(interval_minutes: int) -> None:
     Args:
         interval_minutes: New interval in minutes.
     """
-    job = scheduler.get_job("scrape_all_platforms")
-    if job:
+    try:
         scheduler.reschedule_job(
             "scrape_all_platforms",
-            trigger=IntervalTrigger(minutes=interval_minutes),
+            interval=timedelta(minutes=interval_minutes),
         )
-        logger.info(f"Rescheduled scrape job with interval: {interval_minutes} minutes")
-
-
-def update_cleanup_interval(hours: int) -> None:
-    """Update the cleanup job interval at runtime.
-
-    Reschedules the cleanup_old_data job with the new interval.
-
-    Args:
-        hours: New interval in hours.
-    """
-    job = scheduler.get_job("cleanup_old_data")
-    if job:
-        scheduler.reschedule_job(
-            "cleanup_old_data",
-            trigger=IntervalTrigger(hours=hours),
-        )
-        logger.info(f"Rescheduled cleanup job with interval: {hours} hours")
+    except JobLookupError:
+        logger.warning("Scrape job not configured - interval not updated")
+        return
+    logger.info("Rescheduled scrape job with interval: %d minutes", interval_minutes)
 
 
 def start_scheduler() -> None:
@@ -162,43 +371,73 @@ def start_scheduler() -> None:
         scheduler.start()
 
 
-def shutdown_scheduler(wait: bool = True) -> None:
+async def shutdown_scheduler(wait: bool = True) -> None:
     """Shutdown the scheduler gracefully.
 
+    Also cancels a background cleanup launched by the scrape job, which the
+    runner does not track.
+
     Args:
         wait: If True, wait for running jobs to complete before returning.
     """
+    # Deferred import to avoid circular dependency
+    from src.scheduling.jobs import cancel_cleanup
+
     if scheduler.running:
-        scheduler.shutdown(wait=wait)
+        await scheduler.shutdown(wait=wait)
+    await cancel_cleanup()
 
 
 async def sync_settings_on_startup() -> None:
-    """Sync scheduler intervals from database settings.
-
-    Fetches stored settings and updates scheduler intervals if different from defaults.
-    Called during app lifespan after scheduler is started.
+    """Sync scheduler intervals from the environment or database settings.
+
+    SCRAPE_INTERVAL_MINUTES, when set to a valid interval (1-60, as the
+    settings API enforces), takes precedence and skips the database read;
+    other values are logged and ignored. Otherwise fetches stored settings
+    and updates the scrape interval if different from the default. Called
+    during app lifespan after scheduler is started. Later changes via the
+    settings API still reschedule at runtime.
     """
+    env_interval = os.environ.get("SCRAPE_INTERVAL_MINUTES")
+    if env_interval:
+        try:
+            interval = int(env_interval)
+        except ValueError:
+            interval = None
+        if interval is None or not (
+            MIN_INTERVAL_MINUTES <= interval <= MAX_INTERVAL_MINUTES
+        ):
+            logger.warning(
+                "Ignoring invalid SCRAPE_INTERVAL_MINUTES=%r (expected %d-%d)",
+                env_interval,
+                MIN_INTERVAL_MINUTES,
+                MAX_INTERVAL_MINUTES,
+            )
+        else:
+            if interval != DEFAULT_INTERVAL_MINUTES:
+                update_scheduler_interval(interval)
+            logger.warning(
+                "Scrape interval %d minutes from SCRAPE_INTERVAL_MINUTES "
+                "overrides the stored setting (the settings UI still shows "
+                "the stored value)",
+                interval,
+            )
+            return
+
     settings = await get_settings_from_db()
 
     if settings is None:
-        logger.info(
-            f"Using default intervals: scrape={DEFAULT_INTERVAL_MINUTES}min, "
-            f"cleanup={DEFAULT_CLEANUP_HOURS}h"
-        )
+        logger.info("Using default scrape interval: %dmin", DEFAULT_INTERVAL_MINUTES)
         return
 
     # Sync scrape interval
     stored_interval = settings.scrape_interval_minutes
     if stored_interval != DEFAULT_INTERVAL_MINUTES:
         update_scheduler_interval(stored_interval)
-        logger.info(f"Synced scrape interval from settings: {stored_interval} minutes")
-    else:
-        logger.info(f"Scrape interval matches default: {DEFAULT_INTERVAL_MINUTES} minutes")
-
-    # Sync cleanup interval
-    stored_cleanup_hours = settings.cleanup_frequency_hours
-    if stored_cleanup_hours != DEFAULT_CLEANUP_HOURS:
-        update_cleanup_interval(stored_cleanup_hours)
-        logger.info(f"Synced cleanup interval from settings: {stored_cleanup_hours} hours")
+        logger.info(
+            "Synced scrape interval from settings: %d minutes", stored_interval
+        )
     else:
-        logger.info(f"Cleanup interval matches default: {DEFAULT_CLEANUP_HOURS} hours")
+        logger.info(
+            "Scrape interval matches default: %d minutes", DEFAULT_INTERVAL_MINUTES
+        )
@@ -10,15 +10,16 @@ Detection Algorithm:
     - No phase logs AND ScrapeRun.started_at > threshold
 
 Functions:
-    find_stale_runs(): Query for RUNNING runs exceeding threshold
-    mark_run_stale(): Update status to FAILED with ScrapeError record
+    fail_stale_runs(): Fail all stale runs via UPDATE ... RETURNING and
+        bulk-insert their ScrapeError records
     detect_stale_runs(): Scheduled watchdog job (every 2 minutes)
     recover_stale_runs_on_startup(): Clean up on process restart
 
 Startup Recovery:
     Called BEFORE scheduler starts. Any RUNNING run at startup is stale
     by definition since no orchestrator is active. Marks all as FAILED
-    with "process restarted" message.
+    with "process restarted" message in a single INSERT ... SELECT over an
+    UPDATE ... RETURNING CTE.
 
 Error Recording:
     Creates ScrapeError record with error_type="stale" containing:
@@ -31,10 +32,11 @@ Broadcaster Cleanup:
     to clean up any waiting WebSocket subscribers.
 """
 
+import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import select, func
+from sqlalchemy import Subquery, func, insert, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.engine import async_session_factory
@@ -44,29 +46,30 @@ from src.db.models.scrape import (
     ScrapeRun,
     ScrapeStatus,
 )
+from src.scheduling.timeutil import utcnow
 from src.scraping.broadcaster import progress_registry
 
 logger = logging.getLogger(__name__)
 
+# Error message recorded for runs failed by startup recovery
+_RECOVERED_MESSAGE = (
+    "Run recovered on server startup: process restarted "
+    "while scrape was in progress"
+)
 
-async def find_stale_runs(
-    db: AsyncSession,
-    stale_threshold_minutes: int = 10,
-) -> list[tuple[ScrapeRun, datetime | None]]:
-    """Find RUNNING scrape runs whose last activity exceeds the threshold.
+
+def _stale_runs_subquery(threshold: datetime) -> Subquery:
+    """Build a subquery of RUNNING runs whose last activity is before threshold.
 
     Uses MAX(ScrapePhaseLog.started_at) as last activity indicator, falling
     back to ScrapeRun.started_at when no phase logs exist.
 
     Args:
-        db: Async database session.
-        stale_threshold_minutes: Minutes of inactivity before a run is stale.
+        threshold: Naive UTC cutoff; activity older than this is stale.
 
     Returns:
-        List of (ScrapeRun, last_activity) tuples for stale runs.
+        Subquery with run_id and last_activity (None when no phase logs) columns.
     """
-    threshold = datetime.utcnow() - timedelta(minutes=stale_threshold_minutes)
-
     # Subquery: last activity per run from phase logs
     last_activity_sq = (
         select(
@@ -77,9 +80,9 @@ async def find_stale_runs(
         .subquery()
     )
 
-    # Main query: RUNNING runs with stale activity
-    stmt = (
-        select(ScrapeRun, last_activity_sq.c.last_activity)
+    # RUNNING runs with stale activity
+    return (
+        select(ScrapeRun.id.label("run_id"), last_activity_sq.c.last_activity)
         .outerjoin(
             last_activity_sq,
             ScrapeRun.id == last_activity_sq.c.scrape_run_id,
@@ -93,99 +96,147 @@ async def find_stale_runs(
                 & (ScrapeRun.started_at < threshold)
             )
         )
+        .subquery("stale")
     )
 
-    result = await db.execute(stmt)
-    return [(row[0], row[1]) for row in result.all()]
 
+def _as_naive_utc(dt: datetime) -> datetime:
+    """Normalize a datetime to naive UTC (TIMESTAMP WITHOUT TIME ZONE form).
 
-async def mark_run_stale(
-    db: AsyncSession,
-    run: ScrapeRun,
-    last_activity: datetime | None,
-    message: str | None = None,
-) -> None:
-    """Mark a scrape run as FAILED due to staleness.
+    Args:
+        dt: Naive (assumed UTC) or aware datetime.
+
+    Returns:
+        dt unchanged if naive, else converted to UTC with tzinfo dropped.
+    """
+    if dt.tzinfo is None:
+        return dt
+    return dt.astimezone(timezone.utc).replace(tzinfo=None)
 
-    Only updates if the run is still in RUNNING status (optimistic check).
+
+def _stale_message(
+    now: datetime,
+    last_activity: datetime | None,
+    current_phase: str | None,
+    current_platform: str | None,
+    started_at: datetime,
+) -> str:
+    """Describe how long a run has been stuck and where it stopped.
 
     Args:
-        db: Async database session.
-        run: The stale ScrapeRun to fail.
+        now: Naive UTC reference time.
         last_activity: Timestamp of last detected activity, or None.
-        message: Optional custom error message.
+        current_phase: Last known phase of the run.
+        current_platform: Last known platform of the run.
+        started_at: When the run started.
+
+    Returns:
+        Human-readable stale error message.
     """
-    # Optimistic check: only update if still RUNNING
-    if run.status != ScrapeStatus.RUNNING:
-        return
-
-    now = datetime.utcnow()
-
-    if last_activity is not None and last_activity.tzinfo is not None:
-        last_activity = last_activity.replace(tzinfo=None)
-
-    if message is None:
-        if last_activity:
-            stale_duration = now - last_activity
-            minutes_stale = int(stale_duration.total_seconds() / 60)
-            message = (
-                f"Run stuck in RUNNING for {minutes_stale}min since last activity. "
-                f"Last phase: {run.current_phase or 'unknown'}, "
-                f"last platform: {run.current_platform or 'unknown'}"
-            )
-        else:
-            started_at = run.started_at
-            if started_at.tzinfo is not None:
-                started_at = started_at.replace(tzinfo=None)
-            stale_duration = now - started_at
-            minutes_stale = int(stale_duration.total_seconds() / 60)
-            message = (
-                f"Run stuck in RUNNING for {minutes_stale}min with no phase activity. "
-                f"Started at: {run.started_at.isoformat()}"
-            )
+    if last_activity is not None:
+        minutes_stale = int((now - _as_naive_utc(last_activity)).total_seconds()) // 60
+        return (
+            f"Run stuck in RUNNING for {minutes_stale}min since last activity. "
+            f"Last phase: {current_phase or 'unknown'}, "
+            f"last platform: {current_platform or 'unknown'}"
+        )
+
+    minutes_stale = int((now - _as_naive_utc(started_at)).total_seconds()) // 60
+    return (
+        f"Run stuck in RUNNING for {minutes_stale}min with no phase activity. "
+        f"Started at: {started_at.isoformat()}"
+    )
 
-    run.status = ScrapeStatus.FAILED
-    run.completed_at = now
 
-    error = ScrapeError(
-        scrape_run_id=run.id,
-        error_type="stale",
-        error_message=message,
+async def fail_stale_runs(
+    db: AsyncSession,
+    stale_threshold_minutes: int = 10,
+) -> list[int]:
+    """Mark all stale RUNNING runs FAILED and record their ScrapeErrors.
+
+    One UPDATE ... FROM (stale subquery) ... RETURNING flips the runs; the
+    status = RUNNING condition is re-checked atomically by the database, so
+    runs the orchestrator just completed are left alone. A single multi-row
+    INSERT then records one stale ScrapeError per failed run. Does not commit.
+
+    Args:
+        db: Async database session.
+        stale_threshold_minutes: Minutes of inactivity before a run is stale.
+
+    Returns:
+        IDs of the runs marked FAILED.
+    """
+    now = utcnow()
+    stale = _stale_runs_subquery(now - timedelta(minutes=stale_threshold_minutes))
+
+    result = await db.execute(
+        update(ScrapeRun)
+        .where(ScrapeRun.id == stale.c.run_id)
+        .where(ScrapeRun.status == ScrapeStatus.RUNNING)
+        .values(status=ScrapeStatus.FAILED, completed_at=now)
+        .returning(
+            ScrapeRun.id,
+            ScrapeRun.current_phase,
+            ScrapeRun.current_platform,
+            ScrapeRun.started_at,
+            stale.c.last_activity,
+        )
+        .execution_options(synchronize_session=False)
     )
-    db.add(error)
-    await db.flush()
+    rows = result.all()
+    if not rows:
+        return []
+
+    await db.execute(
+        insert(ScrapeError).values([
+            {
+                "scrape_run_id": row.id,
+                "error_type": "stale",
+                "error_message": _stale_message(
+                    now,
+                    row.last_activity,
+                    row.current_phase,
+                    row.current_platform,
+                    row.started_at,
+                ),
+            }
+            for row in rows
+        ])
+    )
+    return [row.id for row in rows]
 
 
 async def detect_stale_runs() -> None:
     """Scheduled watchdog job: detect and fail stale scrape runs.
 
-    Creates its own database session. Finds all RUNNING runs that exceed
-    the staleness threshold, marks them as FAILED, cleans up broadcasters,
-    and commits once at the end.
+    Creates its own database session. Fails all RUNNING runs that exceed
+    the staleness threshold in one statement, records their errors in
+    another, cleans up broadcasters, and commits once at the end.
     """
     async with async_session_factory() as db:
-        stale_runs = await find_stale_runs(db)
+        stale_run_ids = await fail_stale_runs(db)
 
-        if not stale_runs:
+        if not stale_run_ids:
             logger.debug("No stale scrape runs detected")
             return
 
-        for run, last_activity in stale_runs:
-            # Re-check status in case orchestrator completed it
-            await db.refresh(run)
-            if run.status != ScrapeStatus.RUNNING:
-                continue
-
-            await mark_run_stale(db, run, last_activity)
+        await db.commit()
 
-            # Clean up broadcaster if exists
-            broadcaster = progress_registry.get_broadcaster(run.id)
-            if broadcaster:
-                await broadcaster.close()
-                progress_registry.remove_broadcaster(run.id)
+        # Clean up broadcasters: closes are independent, so run them together
+        broadcasters = [
+            broadcaster
+            for run_id in stale_run_ids
+            if (broadcaster := progress_registry.get_broadcaster(run_id))
+        ]
+        if broadcasters:
+            await asyncio.gather(
+                *(broadcaster.close() for broadcaster in broadcasters),
+                return_exceptions=True,
+            )
+            for broadcaster in broadcasters:
+                progress_registry.remove_broadcaster(broadcaster.scrape_run_id)
 
-        await db.commit()
-        logger.warning(f"Marked {len(stale_runs)} stale scrape run(s) as FAILED")
+        logger.warning(f"Marked {len(stale_run_ids)} stale scrape run(s) as FAILED")
 
 
 async def recover_stale_runs_on_startup() -> int:
@@ -198,28 +249,34 @@ async def recover_stale_runs_on_startup() -> int:
     Returns:
         Count of recovered runs.
     """
+    # Fail every RUNNING run and record its error in one statement:
+    # INSERT INTO scrape_errors SELECT ... FROM (UPDATE ... RETURNING id).
+    # No rows are loaded into Python, however many runs were left behind.
+    recovered = (
+        update(ScrapeRun)
+        .where(ScrapeRun.status == ScrapeStatus.RUNNING)
+        .values(status=ScrapeStatus.FAILED, completed_at=utcnow())
+        .returning(ScrapeRun.id)
+        .cte("recovered")
+    )
+    stmt = insert(ScrapeError).from_select(
+        ["scrape_run_id", "error_type", "error_message"],
+        select(
+            recovered.c.id,
+            literal("stale"),
+            literal(_RECOVERED_MESSAGE),
+        ),
+    )
+
     async with async_session_factory() as db:
-        stmt = select(ScrapeRun).where(ScrapeRun.status == ScrapeStatus.RUNNING)
         result = await db.execute(stmt)
-        running_runs = result.scalars().all()
+        count = result.rowcount
 
-        if not running_runs:
+        if not count:
+            await db.rollback()
             logger.info("No stale runs to recover on startup")
             return 0
 
-        for run in running_runs:
-            await mark_run_stale(
-                db,
-                run,
-                last_activity=None,
-                message=(
-                    "Run recovered on server startup: process restarted "
-                    "while scrape was in progress"
-                ),
-            )
-
         await db.commit()
-        logger.warning(
-            f"Recovered {len(running_runs)} stale scrape run(s) on startup"
-        )
-        return len(running_runs)
+        logger.warning(f"Recovered {count} stale scrape run(s) on startup")
+        return count
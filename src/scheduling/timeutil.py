@@ -0,0 +1,17 @@
+"""UTC time helpers shared by the scheduling modules.
+
+ScrapeRun, CleanupRun and ScrapeProgress timestamps are stored as
+TIMESTAMP WITHOUT TIME ZONE holding naive UTC, so jobs and stale detection
+build them the same way through utcnow().
+"""
+
+from datetime import datetime, timezone
+from typing import Final
+
+# Cached UTC tzinfo for timestamp construction
+UTC: Final = timezone.utc
+
+
+def utcnow() -> datetime:
+    """Return current UTC time as a naive datetime."""
+    return datetime.now(UTC).replace(tzinfo=None)
@@ -4,29 +4,32 @@ This module implements the pub/sub pattern for streaming scrape progress
 to WebSocket clients. It provides:
 
 - ProgressBroadcaster: Per-run broadcaster with subscriber management
+- CoalescingBroadcaster: Publisher wrapper that coalesces bursts of updates
 - ProgressRegistry: Global singleton registry of active broadcasters
 
 Architecture:
-    Scheduled jobs -> ProgressBroadcaster.publish() -> Queue per subscriber
-    WebSocket endpoint -> ProgressBroadcaster.subscribe() -> AsyncGenerator
+    Scheduled jobs -> ProgressBroadcaster.publish() -> latest slot + sequence
+    WebSocket bridge -> ProgressBroadcaster.subscribe() -> AsyncGenerator
 
 Thread Safety:
-    Uses asyncio.Lock for subscriber list mutations. Safe for single-writer
-    (scheduled job) / multi-reader (multiple WebSocket clients) pattern.
+    Uses one asyncio.Condition guarding the slot and sequence. Safe for
+    single-writer (scheduled job) / multi-reader (multiple WebSocket
+    clients) pattern.
 
 Example:
     # In scheduled job
     broadcaster = progress_registry.create_broadcaster(scrape_run_id)
     await broadcaster.publish(progress_event)
 
-    # In WebSocket endpoint
+    # In the WebSocket bridge (src/api/websocket/bridge.py)
     broadcaster = progress_registry.get_broadcaster(scrape_run_id)
     async for progress in broadcaster.subscribe():
-        await websocket.send_json(progress.model_dump())
+        message = scrape_progress_message(progress)
+        await ws_manager.broadcast(message, topic="scrape_progress")
 """
 
 import asyncio
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
 
 from src.scraping.schemas import ScrapeProgress
 
@@ -34,46 +37,69 @@ from src.scraping.schemas import ScrapeProgress
 class ProgressBroadcaster:
     """Broadcasts scrape progress to multiple subscribers.
 
-    Thread-safe progress state management with pub/sub pattern.
-    One broadcaster instance per scrape run.
+    Holds a single latest-progress slot and a sequence number. Publishing
+    stores the slot, bumps the sequence and wakes all subscribers through one
+    condition variable; each subscriber tracks the last sequence it saw and
+    reads the slot. Subscribers that fall behind skip straight to the latest
+    update. One broadcaster instance per scrape run.
     """
 
-    def __init__(self, scrape_run_id: int) -> None:
+    def __init__(
+        self,
+        scrape_run_id: int,
+        on_complete: Callable[[int], None] | None = None,
+    ) -> None:
         """Initialize broadcaster for a scrape run.
 
         Args:
             scrape_run_id: ID of the scrape run to track.
+            on_complete: Called once with scrape_run_id when the run completes
+                (terminal update or close).
         """
         self.scrape_run_id = scrape_run_id
-        self._subscribers: list[asyncio.Queue[ScrapeProgress | None]] = []
+        self._seq = 0
         self._latest_progress: ScrapeProgress | None = None
         self._completed = False
-        self._lock = asyncio.Lock()
+        self._subscriber_count = 0
+        self._cond = asyncio.Condition()
+        self._on_complete = on_complete
+
+    def _mark_completed(self) -> None:
+        """Flag the run completed and fire on_complete the first time."""
+        if self._completed:
+            return
+        self._completed = True
+        if self._on_complete is not None:
+            self._on_complete(self.scrape_run_id)
 
     async def publish(self, progress: ScrapeProgress) -> None:
         """Publish a progress update to all subscribers.
 
+        With no subscribers (the common case for scheduled scrapes nobody is
+        watching) the slot is updated without taking the condition lock:
+        nothing is waiting, and the update runs without an await, so it is
+        atomic on the event loop. Late subscribers still catch up from it.
+
         Args:
             progress: The progress update to broadcast.
         """
-        async with self._lock:
-            self._latest_progress = progress
-
-            # Check if this is the final update
-            if progress.phase in ("completed", "failed") and progress.platform is None:
-                self._completed = True
-
-            # Send to all subscribers
-            for queue in self._subscribers:
-                try:
-                    queue.put_nowait(progress)
-                except asyncio.QueueFull:
-                    # Drop oldest if queue is full
-                    try:
-                        queue.get_nowait()
-                        queue.put_nowait(progress)
-                    except asyncio.QueueEmpty:
-                        pass
+        if self._subscriber_count == 0:
+            self._store(progress)
+            return
+
+        async with self._cond:
+            self._store(progress)
+            self._cond.notify_all()
+
+    def _store(self, progress: ScrapeProgress) -> None:
+        """Write progress into the latest slot and bump the sequence."""
+        self._latest_progress = progress
+
+        # Check if this is the final update
+        if progress.phase in ("completed", "failed") and progress.platform is None:
+            self._mark_completed()
+
+        self._seq += 1
 
     async def subscribe(self) -> AsyncGenerator[ScrapeProgress, None]:
         """Subscribe to progress updates.
@@ -81,51 +107,53 @@ class ProgressBroadcaster:
         Yields progress updates as they arrive. Also yields the latest
         progress immediately if available (for late subscribers).
 
+        Subscribers hold no per-subscriber storage on the broadcaster, so
+        unsubscribing is O(1): the finally block only decrements the count,
+        and it also runs when an abandoned generator is closed or collected.
+
         Yields:
             ScrapeProgress updates.
         """
-        queue: asyncio.Queue[ScrapeProgress | None] = asyncio.Queue(maxsize=50)
-
-        async with self._lock:
-            self._subscribers.append(queue)
-
-            # Send latest progress immediately (catch up)
-            if self._latest_progress:
-                await queue.put(self._latest_progress)
-
-            # If already completed, signal end
-            if self._completed:
-                await queue.put(None)
-
+        seen = 0
+        self._subscriber_count += 1
         try:
             while True:
-                progress = await queue.get()
-                if progress is None:
+                # Plain attribute reads: only wait (under the lock) when there
+                # is nothing new yet, so catch-up reads never take the lock
+                if self._seq == seen and not self._completed:
+                    async with self._cond:
+                        await self._cond.wait_for(
+                            lambda: self._seq != seen or self._completed
+                        )
+
+                # Yield one loop iteration so a burst of publishes collapses
+                # into a single delivery of the latest state
+                await asyncio.sleep(0)
+
+                if self._seq == seen:
+                    # Closed with nothing new to deliver
                     break
+                seen = self._seq
+                progress = self._latest_progress
+
                 yield progress
 
                 # Check for completion
                 if progress.phase in ("completed", "failed") and progress.platform is None:
                     break
         finally:
-            async with self._lock:
-                if queue in self._subscribers:
-                    self._subscribers.remove(queue)
+            self._subscriber_count -= 1
 
     async def close(self) -> None:
         """Close the broadcaster and notify all subscribers."""
-        async with self._lock:
-            self._completed = True
-            for queue in self._subscribers:
-                try:
-                    queue.put_nowait(None)
-                except asyncio.QueueFull:
-                    pass
+        async with self._cond:
+            self._mark_completed()
+            self._cond.notify_all()
 
     @property
     def subscriber_count(self) -> int:
         """Get the number of active subscribers."""
-        return len(self._subscribers)
+        return self._subscriber_count
 
     @property
     def is_completed(self) -> bool:
@@ -138,6 +166,66 @@ class ProgressBroadcaster:
         return self._latest_progress
 
 
+class CoalescingBroadcaster:
+    """Coalesces bursts of progress updates before publishing.
+
+    Non-terminal updates are held per (platform, phase) key and published
+    together once per flush interval, so only the latest update for each key
+    reaches subscribers. Terminal updates (completed/failed) flush pending
+    updates and publish immediately.
+    """
+
+    def __init__(
+        self,
+        broadcaster: ProgressBroadcaster,
+        flush_interval_ms: int = 100,
+    ) -> None:
+        """Initialize the coalescing wrapper.
+
+        Args:
+            broadcaster: The broadcaster to publish to.
+            flush_interval_ms: Coalescing window in milliseconds.
+        """
+        self._broadcaster = broadcaster
+        self._flush_interval = flush_interval_ms / 1000
+        self._pending: dict[tuple[object, object], ScrapeProgress] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+
+    async def publish_coalesced(self, progress: ScrapeProgress) -> None:
+        """Queue a progress update, publishing terminal updates immediately.
+
+        Args:
+            progress: The progress update to broadcast.
+        """
+        if progress.phase in ("completed", "failed"):
+            await self.flush()
+            await self._broadcaster.publish(progress)
+            return
+
+        self._pending[(progress.platform, progress.phase)] = progress
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        """Publish pending updates after the coalescing window."""
+        await asyncio.sleep(self._flush_interval)
+        self._flush_task = None
+        await self._publish_pending()
+
+    async def _publish_pending(self) -> None:
+        """Publish and clear all pending updates."""
+        pending, self._pending = self._pending, {}
+        for progress in pending.values():
+            await self._broadcaster.publish(progress)
+
+    async def flush(self) -> None:
+        """Cancel the pending timer and publish pending updates now."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self._publish_pending()
+
+
 class ProgressRegistry:
     """Global registry of active scrape progress broadcasters.
 
@@ -146,11 +234,13 @@ class ProgressRegistry:
 
     _instance: "ProgressRegistry | None" = None
     _broadcasters: dict[int, ProgressBroadcaster]
+    _active_ids: set[int]
 
     def __new__(cls) -> "ProgressRegistry":
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._broadcasters = {}
+            cls._instance._active_ids = set()
         return cls._instance
 
     @classmethod
@@ -167,8 +257,11 @@ class ProgressRegistry:
         Returns:
             The created broadcaster.
         """
-        broadcaster = ProgressBroadcaster(scrape_run_id)
+        broadcaster = ProgressBroadcaster(
+            scrape_run_id, on_complete=self._active_ids.discard
+        )
         self._broadcasters[scrape_run_id] = broadcaster
+        self._active_ids.add(scrape_run_id)
         return broadcaster
 
     def get_broadcaster(self, scrape_run_id: int) -> ProgressBroadcaster | None:
@@ -189,18 +282,18 @@ class ProgressRegistry:
             scrape_run_id: ID of the scrape run.
         """
         self._broadcasters.pop(scrape_run_id, None)
+        self._active_ids.discard(scrape_run_id)
 
     def get_active_scrape_ids(self) -> list[int]:
         """Get IDs of all active (non-completed) scrapes.
 
+        Maintained incrementally: IDs are added on create_broadcaster() and
+        dropped when the broadcaster completes or is removed.
+
         Returns:
             List of scrape run IDs with active broadcasters.
         """
-        return [
-            run_id
-            for run_id, broadcaster in self._broadcasters.items()
-            if not broadcaster.is_completed
-        ]
+        return list(self._active_ids)
 
 
 # Global registry instance
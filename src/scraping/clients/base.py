@@ -2,39 +2,91 @@
 
 This module defines:
 - ScraperClient: Protocol interface that all platform clients must implement
-- Retry configuration: Exponential backoff with configurable limits
-- create_retry_decorator(): Factory for tenacity @retry decorators
+- Retry configuration: Jittered exponential backoff with configurable limits
+- create_retry_decorator(): Factory for the async retry decorator
+- retry_http: Shared decorator instance built once at import
+- parse_json(): Shared response body decoder
+- fetch_concurrently(): Bounded fan-out used by the clients' batch fetches
+- network_errors(): Decorator mapping connect/timeout failures to NetworkError
+- response_cache(): Short-TTL, single-flight cache for per-ID fetches
+- circuit_breaker(): Fail-fast guard for a platform endpoint during outages
 
 Retry Behavior:
-    - Max 3 attempts with exponential backoff (1s, 2s, 4s base)
+    - Max 3 attempts with full-jitter exponential backoff: a random wait
+      up to 0.2s, then up to 0.4s (ceiling doubles per attempt, capped at 2s)
     - Retries on: HTTPStatusError, TimeoutException, ConnectError
+    - 429/503 responses with a Retry-After header wait that long instead
+      (capped at RETRY_AFTER_MAX_WAIT)
     - Re-raises after final attempt exhausted
 
+The retry loop is hand-rolled rather than built on tenacity: the success
+path (by far the common case) is a single awaited call with no per-call
+retry-state objects.
+
+Event loop:
+    The clients are plain asyncio code and run on whatever loop hosts them.
+    In the API process that is uvicorn's loop, which is uvloop via
+    uvicorn[standard] with the default --loop auto (except on Windows).
+
 All platform clients (Bet9jaClient, BetPawaClient, SportyBetClient) use
-the shared retry decorator to ensure consistent error handling.
+the shared retry_http decorator to ensure consistent error handling.
 """
 
-from typing import Callable, Protocol, TypeVar
+import asyncio
+import email.utils
+import functools
+import inspect
+import math
+import random
+import time
+from typing import Any, Awaitable, Callable, Protocol, Sequence, TypeVar
 
 import httpx
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+from pydantic_core import from_json
+
+from src.scraping.exceptions import NetworkError
 
 T = TypeVar("T")
 
 # Retry configuration constants
 MAX_RETRIES = 3
-RETRY_MIN_WAIT = 1.0  # seconds
-RETRY_MAX_WAIT = 10.0  # seconds
-RETRY_MULTIPLIER = 2.0  # exponential factor
+RETRY_MAX_WAIT = 2.0  # seconds, cap on the backoff ceiling
+RETRY_MULTIPLIER = 0.2  # seconds, ceiling before the first retry
+RETRY_AFTER_MAX_WAIT = 10.0  # seconds, cap on a server-requested Retry-After
+
+# Statuses whose Retry-After header is honoured
+RETRY_AFTER_STATUSES = frozenset({429, 503})
+
+# Default number of in-flight requests for batch event fetches
+DEFAULT_BATCH_CONCURRENCY = 10
+
+# How long a fetched event response is reused (seconds). Odds move on the
+# order of seconds, so this only collapses near-simultaneous duplicates.
+EVENT_CACHE_TTL = 2.0
+
+# Cached entries held before expired ones are swept out
+_RESPONSE_CACHE_PRUNE_AT = 1024
+
+# Circuit breaker: consecutive failed calls before opening, and how long it
+# stays open before a single probe call is let through
+CIRCUIT_FAILURE_THRESHOLD = 10
+CIRCUIT_RESET_TIMEOUT = 30.0  # seconds
+
+# Exceptions that trigger a retry
+RETRY_EXCEPTIONS: tuple[type[Exception], ...] = (
+    httpx.HTTPStatusError,
+    httpx.TimeoutException,
+    httpx.ConnectError,
+)
 
 
 class ScraperClient(Protocol):
-    """Protocol defining the interface for async scraper clients."""
+    """Protocol defining the interface for async scraper clients.
+
+    Implementations wrap an httpx.AsyncClient, which should be the
+    long-lived, process-wide pooled client (app.state) rather than one
+    constructed per request, so TLS connections are reused across calls.
+    """
 
     async def fetch_event(self, event_id: str) -> dict:
         """Fetch single event data.
@@ -47,6 +99,22 @@ class ScraperClient(Protocol):
         """
         ...
 
+    async def fetch_events_batch(
+        self,
+        event_ids: Sequence[str],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[dict | BaseException]:
+        """Fetch several events concurrently.
+
+        Args:
+            event_ids: Platform-specific event identifiers.
+            concurrency: Maximum number of requests in flight.
+
+        Returns:
+            One entry per ID, in order: the event dict or the raised exception.
+        """
+        ...
+
     async def check_health(self) -> bool:
         """Check if the API is reachable.
 
@@ -56,21 +124,353 @@ class ScraperClient(Protocol):
         ...
 
 
-def create_retry_decorator() -> Callable[[Callable[..., T]], Callable[..., T]]:
-    """Create a configured tenacity @retry decorator.
+def _retry_wait(attempt: int) -> float:
+    """Backoff delay after a failed attempt.
+
+    Uses "full jitter": a uniform random wait below an exponentially growing
+    ceiling, so tasks that failed together (e.g. a burst behind the same
+    concurrency gate) don't all retry at the same instant.
+
+    Args:
+        attempt: 1-based number of the attempt that just failed.
+
+    Returns:
+        Seconds to sleep before the next attempt.
+    """
+    ceiling = min(RETRY_MULTIPLIER * 2 ** (attempt - 1), RETRY_MAX_WAIT)
+    return random.uniform(0, ceiling)
+
+
+def _retry_after(exc: Exception) -> float | None:
+    """Server-requested delay from a 429/503 response, if any.
+
+    Args:
+        exc: Exception raised by the failed attempt.
 
     Returns:
-        Configured retry decorator with exponential backoff.
+        Seconds to wait (capped at RETRY_AFTER_MAX_WAIT), or None when the
+        response carries no usable Retry-After header.
     """
-    return retry(
-        retry=retry_if_exception_type(
-            (httpx.HTTPStatusError, httpx.TimeoutException, httpx.ConnectError)
-        ),
-        stop=stop_after_attempt(MAX_RETRIES),
-        wait=wait_exponential(
-            multiplier=RETRY_MULTIPLIER,
-            min=RETRY_MIN_WAIT,
-            max=RETRY_MAX_WAIT,
-        ),
-        reraise=True,
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return None
+    if exc.response.status_code not in RETRY_AFTER_STATUSES:
+        return None
+    value = exc.response.headers.get("retry-after")
+    if not value:
+        return None
+
+    # Either delta-seconds or an HTTP-date (RFC 9110 section 10.2.3)
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        delay = retry_at.timestamp() - time.time()
+    if not math.isfinite(delay):
+        return None
+    return min(max(delay, 0.0), RETRY_AFTER_MAX_WAIT)
+
+
+def create_retry_decorator() -> Callable[
+    [Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]
+]:
+    """Create an async retry decorator with exponential backoff.
+
+    Returns:
+        Decorator that retries RETRY_EXCEPTIONS up to MAX_RETRIES attempts
+        and re-raises the last exception once attempts are exhausted.
+    """
+
+    def decorator(
+        func: Callable[..., Awaitable[T]],
+    ) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            for attempt in range(1, MAX_RETRIES):
+                try:
+                    return await func(*args, **kwargs)
+                except RETRY_EXCEPTIONS as e:
+                    delay = _retry_after(e)
+                    if delay is None:
+                        delay = _retry_wait(attempt)
+                    await asyncio.sleep(delay)
+            return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# Shared decorator used by all platform clients
+retry_http = create_retry_decorator()
+
+
+def network_errors(
+    context: str,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Create a decorator that maps transport failures to NetworkError.
+
+    Wraps a client method so httpx.ConnectError and httpx.TimeoutException
+    are re-raised as NetworkError("Network error fetching <context>: <e>").
+    Apply it inside @retry_http so the retry policy is unchanged.
+
+    Args:
+        context: str.format template naming what was fetched, filled from
+            the method's arguments (e.g. "event {event_id}"). Only rendered
+            on failure.
+
+    Returns:
+        Decorator for async client methods.
+    """
+
+    def decorator(
+        func: Callable[..., Awaitable[T]],
+    ) -> Callable[..., Awaitable[T]]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            try:
+                return await func(*args, **kwargs)
+            except (httpx.ConnectError, httpx.TimeoutException) as e:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                raise NetworkError(
+                    f"Network error fetching {context.format(**bound.arguments)}: {e}",
+                    cause=e,
+                ) from e
+
+        return wrapper
+
+    return decorator
+
+
+class _CircuitBreaker:
+    """CLOSED -> OPEN -> HALF_OPEN state machine for one endpoint.
+
+    Only transport failures, 5xx and 429 count; any other answer from the
+    server (a 4xx, InvalidEventIdError or ApiError) proves it is up.
+    """
+
+    def __init__(self, name: str, threshold: int, reset_timeout: float) -> None:
+        self._name = name
+        self._threshold = threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    def admit(self) -> None:
+        """Raise NetworkError unless the call may go to the network."""
+        if self._opened_at is None:
+            return
+        if self._probing or (
+            time.monotonic() - self._opened_at < self._reset_timeout
+        ):
+            raise NetworkError(
+                f"{self._name} skipped: circuit open after "
+                f"{self._failures} consecutive failures"
+            )
+        # HALF_OPEN: let this one call through as a probe
+        self._probing = True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self._probing = False
+        self._failures += 1
+        if self._failures >= self._threshold:
+            self._opened_at = time.monotonic()
+
+    def release_probe(self) -> None:
+        """Allow another probe after one ended without a verdict."""
+        self._probing = False
+
+
+def _is_circuit_failure(exc: BaseException) -> bool:
+    """Whether exc means the endpoint is down or shedding load."""
+    if isinstance(exc, NetworkError):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status >= 500 or status == 429
+    return False
+
+
+def circuit_breaker(
+    threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+    reset_timeout: float = CIRCUIT_RESET_TIMEOUT,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Create a decorator that fails fast while an endpoint is down.
+
+    After ``threshold`` consecutive calls end in NetworkError or a
+    (retry-exhausted) 5xx/429 HTTPStatusError, further calls raise
+    NetworkError immediately without touching the network. After
+    ``reset_timeout`` seconds one probe call is admitted; its success closes
+    the circuit, its failure re-opens it. State is per decorated method, i.e. shared by
+    every instance of a client class, so it tracks the platform rather than
+    a wrapper. Apply it outside @retry_http.
+
+    Args:
+        threshold: Consecutive failures that open the circuit.
+        reset_timeout: Seconds to stay open before probing.
+
+    Returns:
+        Decorator for async client methods.
+    """
+
+    def decorator(
+        func: Callable[..., Awaitable[T]],
+    ) -> Callable[..., Awaitable[T]]:
+        breaker = _CircuitBreaker(func.__qualname__, threshold, reset_timeout)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            breaker.admit()
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                if _is_circuit_failure(e):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                raise
+            except BaseException:
+                # Cancelled: no verdict on the endpoint either way
+                breaker.release_probe()
+                raise
+            breaker.record_success()
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+class _ResponseCache:
+    """Per-instance TTL cache with single-flight fetches.
+
+    Concurrent callers for the same key share one in-flight task; successful
+    results are then served from memory until the TTL lapses. Failures are
+    not cached. Every caller receives the same object, not a copy.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self._ttl = ttl
+        self._entries: dict[str, tuple[float, Any]] = {}
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    async def get(self, key: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._on_done, key))
+        # Shield so one cancelled caller doesn't cancel the shared fetch
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: str, task: asyncio.Task) -> None:
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        now = time.monotonic()
+        if len(self._entries) >= _RESPONSE_CACHE_PRUNE_AT:
+            self._entries = {
+                k: v for k, v in self._entries.items() if v[0] > now
+            }
+        self._entries[key] = (now + self._ttl, task.result())
+
+
+def response_cache(
+    ttl: float = EVENT_CACHE_TTL,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Create a decorator caching a client method's result per ID.
+
+    Intended for ``fetch_event(self, event_id)``: duplicate calls for the
+    same ID within ``ttl`` seconds, or while a request is already in flight,
+    share one network round trip. Each client instance keeps its own cache.
+    Apply it outside @retry_http so a single (retried) fetch serves everyone.
+
+    The cached result is shared, not copied: callers must treat it as
+    read-only.
+
+    Args:
+        ttl: Seconds a successful response is reused.
+
+    Returns:
+        Decorator for async methods taking a single string ID.
+    """
+
+    def decorator(
+        func: Callable[..., Awaitable[T]],
+    ) -> Callable[..., Awaitable[T]]:
+        cache_attr = f"_{func.__name__}_cache"
+
+        @functools.wraps(func)
+        async def wrapper(self: Any, key: str) -> T:
+            cache = self.__dict__.get(cache_attr)
+            if cache is None:
+                cache = self.__dict__[cache_attr] = _ResponseCache(ttl)
+            return await cache.get(key, functools.partial(func, self, key))
+
+        return wrapper
+
+    return decorator
+
+
+def parse_json(response: httpx.Response) -> Any:
+    """Decode a response body as JSON.
+
+    Parses the raw bytes with pydantic-core's Rust decoder, which is several
+    times faster than httpx's stdlib-based ``response.json()`` on the large
+    event and tournament payloads and skips the intermediate str decode.
+
+    Args:
+        response: Completed httpx response.
+
+    Returns:
+        Parsed JSON value.
+
+    Raises:
+        ValueError: If the body is not valid JSON.
+    """
+    return from_json(response.content)
+
+
+async def fetch_concurrently(
+    fetch: Callable[[str], Awaitable[T]],
+    ids: Sequence[str],
+    concurrency: int,
+) -> list[T | BaseException]:
+    """Run ``fetch`` over ``ids`` with at most ``concurrency`` calls in flight.
+
+    Failures are returned in place rather than raised, so one bad ID does
+    not cancel the rest of the batch.
+
+    Args:
+        fetch: Single-item coroutine function, e.g. a client's fetch_event.
+        ids: Identifiers to fetch.
+        concurrency: Maximum number of concurrent calls.
+
+    Returns:
+        Results in the same order as ``ids``; failed items hold the exception.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_one(item_id: str) -> T:
+        async with semaphore:
+            return await fetch(item_id)
+
+    return await asyncio.gather(
+        *(fetch_one(item_id) for item_id in ids),
+        return_exceptions=True,
     )
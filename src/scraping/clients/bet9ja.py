@@ -19,12 +19,21 @@ Retry Behavior:
     Retries on network errors and timeouts, not on 404/invalid event.
 """
 
-import json
+from collections.abc import Sequence
+from urllib.parse import quote
 
 import httpx
 
-from src.scraping.clients.base import create_retry_decorator
-from src.scraping.exceptions import ApiError, InvalidEventIdError, NetworkError
+from src.scraping.clients.base import (
+    DEFAULT_BATCH_CONCURRENCY,
+    circuit_breaker,
+    fetch_concurrently,
+    network_errors,
+    parse_json,
+    response_cache,
+    retry_http,
+)
+from src.scraping.exceptions import ApiError, InvalidEventIdError
 
 # Bet9ja API configuration
 BASE_URL = "https://sports.bet9ja.com"
@@ -33,9 +42,27 @@ HEADERS = {
     "accept-language": "en-GB,en-US;q=0.9,en;q=0.8",
     "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36",
 }
-
-# Create retry decorator
-_retry = create_retry_decorator()
+CACHE_VERSION = "1.301.2.225"
+
+# Prebuilt per-request values: headers are normalized once and the fixed
+# query strings are encoded once, so each call only appends its ID.
+_HEADERS = httpx.Headers(HEADERS)
+_PALIMPSEST_URL = f"{BASE_URL}/desktop/feapi/PalimpsestAjax"
+_EVENT_URL_PREFIX = (
+    f"{_PALIMPSEST_URL}/GetEvent?v_cache_version={CACHE_VERSION}&EVENTID="
+)
+_EVENTS_URL_PREFIX = (
+    f"{_PALIMPSEST_URL}/GetEventsInGroupV2"
+    f"?DISP=0&GROUPMARKETID=1&v_cache_version={CACHE_VERSION}&GROUPID="
+)
+# Parsed once; httpx reuses a URL instance as is
+_SPORTS_URL = httpx.URL(
+    f"{_PALIMPSEST_URL}/GetSports?DISP=0&v_cache_version={CACHE_VERSION}"
+)
+
+# GetEvent result codes: True = event payload present, False = not found.
+# Any other code is an unexpected API error.
+_EVENT_RESULT_FOUND: dict[str, bool] = {"D": True, "OK": True, "E": False}
 
 
 def _validate_response_success(data: dict, context: str) -> None:
@@ -73,7 +100,10 @@ class Bet9jaClient:
         """
         self._client = client
 
-    @_retry
+    @response_cache()
+    @circuit_breaker()
+    @retry_http
+    @network_errors("event {event_id}")
     async def fetch_event(self, event_id: str) -> dict:
         """Fetch full event details from Bet9ja API.
 
@@ -88,25 +118,15 @@ class Bet9jaClient:
             NetworkError: If a connection or timeout error occurs.
             ApiError: If response structure is invalid.
         """
-        try:
-            response = await self._client.get(
-                f"{BASE_URL}/desktop/feapi/PalimpsestAjax/GetEvent",
-                params={
-                    "EVENTID": event_id,
-                    "v_cache_version": "1.301.2.225",
-                },
-                headers=HEADERS,
-            )
-            response.raise_for_status()
-        except (httpx.ConnectError, httpx.TimeoutException) as e:
-            raise NetworkError(
-                f"Network error fetching event {event_id}: {e}",
-                cause=e,
-            ) from e
+        response = await self._client.get(
+            _EVENT_URL_PREFIX + quote(event_id, safe=""),
+            headers=_HEADERS,
+        )
+        response.raise_for_status()
 
         try:
-            data = response.json()
-        except json.JSONDecodeError as e:
+            data = parse_json(response)
+        except ValueError as e:
             raise ApiError(
                 f"Invalid JSON response for event {event_id}",
                 details={"response_text": response.text[:500], "error": str(e)},
@@ -120,7 +140,13 @@ class Bet9jaClient:
             )
 
         result_code = data.get("R")
-        if result_code in ("D", "OK"):
+        # Non-string codes (possibly unhashable) fall through to ApiError
+        found = (
+            _EVENT_RESULT_FOUND.get(result_code)
+            if isinstance(result_code, str)
+            else None
+        )
+        if found:
             # Success - return the D payload (GetEvent returns "D" or "OK")
             d_data = data.get("D")
             if not isinstance(d_data, dict):
@@ -129,7 +155,7 @@ class Bet9jaClient:
                     details={"response": data},
                 )
             return d_data
-        elif result_code == "E":
+        elif found is False:
             # Event not found
             raise InvalidEventIdError(
                 event_id=event_id,
@@ -141,7 +167,25 @@ class Bet9jaClient:
                 details={"response": data},
             )
 
-    @_retry
+    async def fetch_events_batch(
+        self,
+        event_ids: Sequence[str],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[dict | BaseException]:
+        """Fetch several events concurrently via fetch_event.
+
+        Args:
+            event_ids: Bet9ja event IDs.
+            concurrency: Maximum number of requests in flight.
+
+        Returns:
+            One entry per ID, in order: the fetch_event result or the
+            exception it raised.
+        """
+        return await fetch_concurrently(self.fetch_event, event_ids, concurrency)
+
+    @retry_http
+    @network_errors("events for tournament {tournament_id}")
     async def fetch_events(self, tournament_id: str) -> list[dict]:
         """Fetch events for a tournament from Bet9ja API.
 
@@ -155,27 +199,15 @@ class Bet9jaClient:
             NetworkError: If a connection or timeout error occurs.
             ApiError: If response structure is invalid.
         """
-        try:
-            response = await self._client.get(
-                f"{BASE_URL}/desktop/feapi/PalimpsestAjax/GetEventsInGroupV2",
-                params={
-                    "GROUPID": tournament_id,
-                    "DISP": "0",
-                    "GROUPMARKETID": "1",
-                    "v_cache_version": "1.301.2.225",
-                },
-                headers=HEADERS,
-            )
-            response.raise_for_status()
-        except (httpx.ConnectError, httpx.TimeoutException) as e:
-            raise NetworkError(
-                f"Network error fetching events for tournament {tournament_id}: {e}",
-                cause=e,
-            ) from e
+        response = await self._client.get(
+            _EVENTS_URL_PREFIX + quote(tournament_id, safe=""),
+            headers=_HEADERS,
+        )
+        response.raise_for_status()
 
         try:
-            data = response.json()
-        except json.JSONDecodeError as e:
+            data = parse_json(response)
+        except ValueError as e:
             raise ApiError(
                 f"Invalid JSON response for tournament {tournament_id}",
                 details={"response_text": response.text[:500], "error": str(e)},
@@ -198,7 +230,8 @@ class Bet9jaClient:
 
         return events_data
 
-    @_retry
+    @retry_http
+    @network_errors("sports")
     async def fetch_sports(self) -> dict:
         """Fetch sports data from Bet9ja API for connectivity test.
 
@@ -209,25 +242,15 @@ class Bet9jaClient:
             NetworkError: If a connection or timeout error occurs.
             ApiError: If response structure is invalid.
         """
-        try:
-            response = await self._client.get(
-                f"{BASE_URL}/desktop/feapi/PalimpsestAjax/GetSports",
-                params={
-                    "DISP": "0",
-                    "v_cache_version": "1.301.2.225",
-                },
-                headers=HEADERS,
-            )
-            response.raise_for_status()
-        except (httpx.ConnectError, httpx.TimeoutException) as e:
-            raise NetworkError(
-                f"Network error fetching sports: {e}",
-                cause=e,
-            ) from e
+        response = await self._client.get(
+            _SPORTS_URL,
+            headers=_HEADERS,
+        )
+        response.raise_for_status()
 
         try:
-            data = response.json()
-        except json.JSONDecodeError as e:
+            data = parse_json(response)
+        except ValueError as e:
             raise ApiError(
                 f"Invalid JSON response for sports",
                 details={"response_text": response.text[:500], "error": str(e)},
@@ -257,12 +280,14 @@ class Bet9jaClient:
             True if healthy, False otherwise.
         """
         try:
-            response = await self._client.get(
-                f"{BASE_URL}/desktop/feapi/PalimpsestAjax/GetSports",
-                params={"DISP": "0", "v_cache_version": "1.301.2.225"},
-                headers=HEADERS,
+            # Stream so only the response headers are awaited; the body
+            # (the full sports listing) is never read
+            async with self._client.stream(
+                "GET",
+                _SPORTS_URL,
+                headers=_HEADERS,
                 timeout=5.0,
-            )
-            return response.status_code == 200
+            ) as response:
+                return response.status_code == 200
         except Exception:
             return False
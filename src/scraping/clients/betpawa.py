@@ -22,12 +22,21 @@ Retry Behavior:
 """
 
 import json
+from collections.abc import Sequence
 from urllib.parse import quote
 
 import httpx
 
-from src.scraping.clients.base import create_retry_decorator
-from src.scraping.exceptions import ApiError, InvalidEventIdError, NetworkError
+from src.scraping.clients.base import (
+    DEFAULT_BATCH_CONCURRENCY,
+    circuit_breaker,
+    fetch_concurrently,
+    network_errors,
+    parse_json,
+    response_cache,
+    retry_http,
+)
+from src.scraping.exceptions import ApiError, InvalidEventIdError
 
 # BetPawa API configuration
 BASE_URL = "https://www.betpawa.ng"
@@ -39,8 +48,53 @@ HEADERS = {
     "x-pawa-brand": "betpawa-nigeria",
 }
 
-# Create retry decorator
-_retry = create_retry_decorator()
+# Headers normalized once instead of on every request
+_HEADERS = httpx.Headers(HEADERS)
+# Parsed once; httpx reuses a URL instance as is
+_HEALTH_URL = httpx.URL(f"{BASE_URL}/api/sportsbook/v3/categories/list/2")
+
+
+def _build_events_query_template() -> str:
+    """Pre-encode the fetch_events ``q`` parameter as a %-format template.
+
+    The query JSON is fixed apart from state, competition and paging, so it
+    is serialized and URL-quoted once with sentinel values. The sentinels are
+    then swapped for %-placeholders, leaving a single string substitution per
+    call.
+
+    Returns:
+        URL-quoted query JSON with ``%(name)s`` placeholders.
+    """
+    query = {
+        "queries": [
+            {
+                "query": {
+                    "eventType": "__state__",
+                    "categories": ["2"],  # Football
+                    "zones": {"competitions": ["__competition_id__"]},
+                    "hasOdds": True,
+                },
+                "view": {},
+                "skip": "__skip__",
+                "take": "__take__",
+            }
+        ]
+    }
+    template = quote(json.dumps(query)).replace("%", "%%")
+    for name in ("state", "competition_id"):
+        template = template.replace(f"__{name}__", f"%({name})s")
+    for name in ("skip", "take"):
+        # Drop the (quoted) JSON string quotes so the ints serialize bare
+        template = template.replace(f"%%22__{name}__%%22", f"%({name})d")
+    return template
+
+
+_EVENTS_QUERY_TEMPLATE = _build_events_query_template()
+
+
+def _quote_json_str(value: str) -> str:
+    """JSON-escape and URL-quote a string for insertion between quotes."""
+    return quote(json.dumps(value)[1:-1])
 
 
 def _validate_response_structure(data: dict) -> None:
@@ -76,7 +130,10 @@ class BetPawaClient:
         """
         self._client = client
 
-    @_retry
+    @response_cache()
+    @circuit_breaker()
+    @retry_http
+    @network_errors("event {event_id}")
     async def fetch_event(self, event_id: str) -> dict:
         """Fetch event data from BetPawa API.
 
@@ -91,28 +148,22 @@ class BetPawaClient:
             NetworkError: If a connection or timeout error occurs.
             ApiError: If response structure is invalid.
         """
-        try:
-            response = await self._client.get(
-                f"{BASE_URL}/api/sportsbook/v3/events/{event_id}",
-                headers=HEADERS,
+        response = await self._client.get(
+            f"{BASE_URL}/api/sportsbook/v3/events/{event_id}",
+            headers=_HEADERS,
+        )
+
+        if response.status_code == 404:
+            raise InvalidEventIdError(
+                event_id=event_id,
+                message="Event not found",
             )
 
-            if response.status_code == 404:
-                raise InvalidEventIdError(
-                    event_id=event_id,
-                    message="Event not found",
-                )
-
-            response.raise_for_status()
-        except (httpx.ConnectError, httpx.TimeoutException) as e:
-            raise NetworkError(
-                f"Network error fetching event {event_id}: {e}",
-                cause=e,
-            ) from e
+        response.raise_for_status()
 
         try:
-            data = response.json()
-        except json.JSONDecodeError as e:
+            data = parse_json(response)
+        except ValueError as e:
             raise ApiError(
                 f"Invalid JSON response for event {event_id}",
                 details={"response_text": response.text[:500], "error": str(e)},
@@ -121,7 +172,25 @@ class BetPawaClient:
 
         return data
 
-    @_retry
+    async def fetch_events_batch(
+        self,
+        event_ids: Sequence[str],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[dict | BaseException]:
+        """Fetch several events concurrently via fetch_event.
+
+        Args:
+            event_ids: BetPawa event IDs.
+            concurrency: Maximum number of requests in flight.
+
+        Returns:
+            One entry per ID, in order: the fetch_event result or the
+            exception it raised.
+        """
+        return await fetch_concurrently(self.fetch_event, event_ids, concurrency)
+
+    @retry_http
+    @network_errors("events for competition {competition_id}")
     async def fetch_events(
         self,
         competition_id: str,
@@ -144,39 +213,22 @@ class BetPawaClient:
             NetworkError: If a connection or timeout error occurs.
             ApiError: If response structure is invalid.
         """
-        query = {
-            "queries": [
-                {
-                    "query": {
-                        "eventType": state,
-                        "categories": ["2"],  # Football
-                        "zones": {"competitions": [competition_id]},
-                        "hasOdds": True,
-                    },
-                    "view": {},
-                    "skip": (page - 1) * size,
-                    "take": size,
-                }
-            ]
+        q_param = _EVENTS_QUERY_TEMPLATE % {
+            "state": _quote_json_str(state),
+            "competition_id": _quote_json_str(competition_id),
+            "skip": (page - 1) * size,
+            "take": size,
         }
 
-        q_param = quote(json.dumps(query))
-
-        try:
-            response = await self._client.get(
-                f"{BASE_URL}/api/sportsbook/v3/events/lists/by-queries?q={q_param}",
-                headers=HEADERS,
-            )
-            response.raise_for_status()
-        except (httpx.ConnectError, httpx.TimeoutException) as e:
-            raise NetworkError(
-                f"Network error fetching events for competition {competition_id}: {e}",
-                cause=e,
-            ) from e
+        response = await self._client.get(
+            f"{BASE_URL}/api/sportsbook/v3/events/lists/by-queries?q={q_param}",
+            headers=_HEADERS,
+        )
+        response.raise_for_status()
 
         try:
-            data = response.json()
-        except json.JSONDecodeError as e:
+            data = parse_json(response)
+        except ValueError as e:
             raise ApiError(
                 f"Invalid JSON response for competition {competition_id}",
                 details={"response_text": response.text[:500], "error": str(e)},
@@ -190,7 +242,8 @@ class BetPawaClient:
 
         return data
 
-    @_retry
+    @retry_http
+    @network_errors("categories")
     async def fetch_categories(self, category_id: str = "2") -> dict:
         """Fetch categories list with regions and competitions.
 
@@ -204,21 +257,15 @@ class BetPawaClient:
             NetworkError: If a connection or timeout error occurs.
             ApiError: If response structure is invalid.
         """
-        try:
-            response = await self._client.get(
-                f"{BASE_URL}/api/sportsbook/v3/categories/list/{category_id}",
-                headers=HEADERS,
-            )
-            response.raise_for_status()
-        except (httpx.ConnectError, httpx.TimeoutException) as e:
-            raise NetworkError(
-                f"Network error fetching categories: {e}",
-                cause=e,
-            ) from e
+        response = await self._client.get(
+            f"{BASE_URL}/api/sportsbook/v3/categories/list/{category_id}",
+            headers=_HEADERS,
+        )
+        response.raise_for_status()
 
         try:
-            data = response.json()
-        except json.JSONDecodeError as e:
+            data = parse_json(response)
+        except ValueError as e:
             raise ApiError(
                 f"Invalid JSON response for categories",
                 details={"response_text": response.text[:500], "error": str(e)},
@@ -239,11 +286,14 @@ class BetPawaClient:
             True if healthy, False otherwise.
         """
         try:
-            response = await self._client.get(
-                f"{BASE_URL}/api/sportsbook/v3/categories/list/2",
-                headers=HEADERS,
+            # Stream so only the response headers are awaited; the body
+            # (the football category listing) is never read
+            async with self._client.stream(
+                "GET",
+                _HEALTH_URL,
+                headers=_HEADERS,
                 timeout=5.0,
-            )
-            return response.status_code == 200
+            ) as response:
+                return response.status_code == 200
         except Exception:
             return False
@@ -23,12 +23,22 @@ Retry Behavior:
     Non-10000 bizCode for event fetch raises InvalidEventIdError.
 """
 
-import json
-import time
+from collections.abc import Sequence
+from time import time_ns
+from urllib.parse import quote
 
 import httpx
-
-from src.scraping.clients.base import create_retry_decorator
+from pydantic_core import to_json
+
+from src.scraping.clients.base import (
+    DEFAULT_BATCH_CONCURRENCY,
+    circuit_breaker,
+    fetch_concurrently,
+    network_errors,
+    parse_json,
+    response_cache,
+    retry_http,
+)
 from src.scraping.exceptions import ApiError, InvalidEventIdError, NetworkError
 
 # SportyBet API configuration
@@ -42,25 +52,26 @@ HEADERS = {
     "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36",
 }
 
-# Create retry decorator
-_retry = create_retry_decorator()
+# Headers normalized once instead of on every request
+_HEADERS = httpx.Headers(HEADERS)
+_JSON_HEADERS = httpx.Headers({**HEADERS, "content-type": "application/json"})
+_EVENT_URL = f"{BASE_URL}/api/ng/factsCenter/event"
+# Fully constant URLs are parsed once here; httpx reuses a URL instance as is
+_HEALTH_URL = httpx.URL(f"{_EVENT_URL}?eventId=sr%3Amatch%3A1&productId=3")
+_PC_EVENTS_URL = httpx.URL(f"{BASE_URL}/api/ng/factsCenter/pcEvents")
 
+# 4xx statuses that mean the event ID itself is unknown or malformed; other
+# 4xx statuses mean the platform is rejecting us
+_INVALID_EVENT_STATUSES: frozenset[int] = frozenset({400, 404, 410})
 
-def _validate_response_structure(data: dict, event_id: str) -> None:
-    """Validate API response structure.
+# pcEvents request body with the fixed parts pre-serialized; only the
+# JSON-encoded market IDs and tournament ID are substituted per call
+_PC_EVENTS_BODY = b'[{"sportId":"sr:sport:1","marketId":%b,"tournamentId":[[%b]]}]'
 
-    Args:
-        data: Parsed API response.
-        event_id: Event ID for error context.
 
-    Raises:
-        ApiError: If 'data' key is missing.
-    """
-    if "data" not in data:
-        raise ApiError(
-            f"Response missing 'data' key for event {event_id}",
-            details={"response": data},
-        )
+def _timestamp_ms() -> str:
+    """Return the current Unix time in milliseconds for the ``_t`` cache-buster."""
+    return str(time_ns() // 1_000_000)
 
 
 class SportyBetClient:
@@ -74,7 +85,10 @@ class SportyBetClient:
         """
         self._client = client
 
-    @_retry
+    @response_cache()
+    @circuit_breaker()
+    @retry_http
+    @network_errors("event {event_id}")
     async def fetch_event(self, event_id: str) -> dict:
         """Fetch event data from SportyBet API.
 
@@ -85,48 +99,80 @@ class SportyBetClient:
             Inner event data payload (data["data"]).
 
         Raises:
-            InvalidEventIdError: If the API returns a non-success bizCode.
-            NetworkError: If a connection or timeout error occurs.
+            InvalidEventIdError: If the API returns a non-success bizCode or
+                a 400/404/410 status.
+            NetworkError: If a connection or timeout error occurs, or the
+                request is rejected with another 4xx (e.g. 403) status.
             ApiError: If response structure is invalid.
         """
-        params = {
-            "eventId": event_id,
-            "productId": "3",
-            "_t": str(int(time.time() * 1000)),
-        }
-
-        try:
-            response = await self._client.get(
-                f"{BASE_URL}/api/ng/factsCenter/event",
-                params=params,
-                headers=HEADERS,
-            )
+        # Query string built directly (same encoding httpx's params= would
+        # produce) to skip the per-call params dict merge
+        response = await self._client.get(
+            f"{_EVENT_URL}?eventId={quote(event_id, safe='')}"
+            f"&productId=3&_t={_timestamp_ms()}",
+            headers=_HEADERS,
+        )
+        status = response.status_code
+        if status != 200:
+            # Business errors arrive as 200 + bizCode, so retrying a 4xx
+            # can't help. Only 400/404/410 point at the event ID; other 4xx
+            # (401/403/407/451...) mean we are blocked, which the circuit
+            # breaker must count. 429 and 5xx go through raise_for_status so
+            # the retry decorator handles them.
+            if status in _INVALID_EVENT_STATUSES:
+                raise InvalidEventIdError(
+                    event_id=event_id,
+                    message=f"HTTP {status} for event {event_id}",
+                )
+            if 400 <= status < 500 and status != 429:
+                raise NetworkError(
+                    f"HTTP {status} for event {event_id}: request rejected"
+                )
             response.raise_for_status()
-        except (httpx.ConnectError, httpx.TimeoutException) as e:
-            raise NetworkError(
-                f"Network error fetching event {event_id}: {e}",
-                cause=e,
-            ) from e
 
         try:
-            data = response.json()
-        except json.JSONDecodeError as e:
+            data = parse_json(response)
+        except ValueError as e:
             raise ApiError(
                 f"Invalid JSON response for event {event_id}",
                 details={"response_text": response.text[:500], "error": str(e)},
             ) from e
 
-        if data.get("bizCode") != 10000:
+        biz_code = data.get("bizCode")
+        if biz_code != 10000:
             raise InvalidEventIdError(
                 event_id=event_id,
-                message=f"bizCode={data.get('bizCode')}: {data.get('message', 'Unknown error')}",
+                message=f"bizCode={biz_code}: {data.get('message', 'Unknown error')}",
+            )
+
+        inner = data.get("data")
+        if inner is None:
+            raise ApiError(
+                f"Response missing 'data' key for event {event_id}",
+                details={"response": data},
             )
 
-        _validate_response_structure(data, event_id)
+        return inner
+
+    async def fetch_events_batch(
+        self,
+        event_ids: Sequence[str],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[dict | BaseException]:
+        """Fetch several events concurrently via fetch_event.
+
+        Args:
+            event_ids: SportyBet event IDs.
+            concurrency: Maximum number of requests in flight.
 
-        return data["data"]
+        Returns:
+            One entry per ID, in order: the fetch_event result or the
+            exception it raised.
+        """
+        return await fetch_concurrently(self.fetch_event, event_ids, concurrency)
 
-    @_retry
+    @retry_http
+    @network_errors("tournaments")
     async def fetch_tournaments(self, sport_id: str = "sr:sport:1") -> dict:
         """Fetch tournament hierarchy from SportyBet API.
 
@@ -144,25 +190,19 @@ class SportyBetClient:
             "sportId": sport_id,
             "timeline": "",
             "productId": "3",
-            "_t": str(int(time.time() * 1000)),
+            "_t": _timestamp_ms(),
         }
 
-        try:
-            response = await self._client.get(
-                f"{BASE_URL}/api/ng/factsCenter/popularAndSportList",
-                params=params,
-                headers=HEADERS,
-            )
-            response.raise_for_status()
-        except (httpx.ConnectError, httpx.TimeoutException) as e:
-            raise NetworkError(
-                f"Network error fetching tournaments: {e}",
-                cause=e,
-            ) from e
+        response = await self._client.get(
+            f"{BASE_URL}/api/ng/factsCenter/popularAndSportList",
+            params=params,
+            headers=_HEADERS,
+        )
+        response.raise_for_status()
 
         try:
-            data = response.json()
-        except json.JSONDecodeError as e:
+            data = parse_json(response)
+        except ValueError as e:
             raise ApiError(
                 f"Invalid JSON response for tournaments",
                 details={"response_text": response.text[:500], "error": str(e)},
@@ -176,7 +216,8 @@ class SportyBetClient:
 
         return data
 
-    @_retry
+    @retry_http
+    @network_errors("events for tournament {tournament_id}")
     async def fetch_events_by_tournament(
         self,
         tournament_id: str,
@@ -197,35 +238,18 @@ class SportyBetClient:
             NetworkError: If a connection or timeout error occurs.
             ApiError: If response structure is invalid or bizCode != 10000.
         """
-        payload = [
-            {
-                "sportId": "sr:sport:1",
-                "marketId": market_ids,
-                "tournamentId": [[tournament_id]],
-            }
-        ]
-
-        headers_with_content_type = {
-            **HEADERS,
-            "content-type": "application/json",
-        }
+        body = _PC_EVENTS_BODY % (to_json(market_ids), to_json(tournament_id))
 
-        try:
-            response = await self._client.post(
-                f"{BASE_URL}/api/ng/factsCenter/pcEvents",
-                json=payload,
-                headers=headers_with_content_type,
-            )
-            response.raise_for_status()
-        except (httpx.ConnectError, httpx.TimeoutException) as e:
-            raise NetworkError(
-                f"Network error fetching events for tournament {tournament_id}: {e}",
-                cause=e,
-            ) from e
+        response = await self._client.post(
+            _PC_EVENTS_URL,
+            content=body,
+            headers=_JSON_HEADERS,
+        )
+        response.raise_for_status()
 
         try:
-            data = response.json()
-        except json.JSONDecodeError as e:
+            data = parse_json(response)
+        except ValueError as e:
             raise ApiError(
                 f"Invalid JSON response for tournament {tournament_id}",
                 details={"response_text": response.text[:500], "error": str(e)},
@@ -254,13 +278,15 @@ class SportyBetClient:
             True if healthy, False otherwise.
         """
         try:
-            response = await self._client.get(
-                f"{BASE_URL}/api/ng/factsCenter/event",
-                params={"eventId": "sr:match:1", "productId": "3"},
-                headers=HEADERS,
+            # Stream so only the response headers are awaited; the body of
+            # the dummy-event lookup is never read
+            async with self._client.stream(
+                "GET",
+                _HEALTH_URL,
+                headers=_HEADERS,
                 timeout=5.0,
-            )
-            # Any response (even error) means API is reachable
-            return response.status_code in (200, 400, 404)
+            ) as response:
+                # Any response (even error) means API is reachable
+                return response.status_code in (200, 400, 404)
         except Exception:
             return False
@@ -431,57 +431,42 @@ class EventCoordinator:
                             need_full_fetch=len(betpawa_event_ids),
                         )
 
-                        # Fetch full event details (with SR ID in widgets array)
-                        # Uses nested semaphore for concurrency control
-                        event_semaphore = asyncio.Semaphore(10)
-
-                        async def fetch_full_event(
-                            event_id: str, kickoff: datetime
-                        ) -> dict | None:
-                            async with event_semaphore:
-                                try:
-                                    full_data = await client.fetch_event(event_id)
-                                    # Extract SR ID from widgets array
-                                    # BetPawa's widget.id IS the SportRadar ID (8-digit numeric)
-                                    widgets = full_data.get("widgets", [])
-                                    sr_id = None
-                                    for widget in widgets:
-                                        if widget.get("type") == "SPORTRADAR":
-                                            sr_id = widget.get("id")
-                                            if sr_id:
-                                                sr_id = str(sr_id)
-                                            break
+                        # Fetch full event details (SR ID is in the widgets array)
+                        # only for events whose list entry lacked it
+                        events_from_full: list[dict] = []
+                        if betpawa_event_ids:
+                            results = await client.fetch_events_batch(
+                                [eid for eid, _ in betpawa_event_ids],
+                                concurrency=10,
+                            )
 
-                                    if sr_id:
-                                        return {
-                                            "sr_id": sr_id,
-                                            "kickoff": kickoff,
-                                            "platform_id": event_id,
-                                        }
-                                except Exception as e:
+                            for (event_id, kickoff), full_data in zip(
+                                betpawa_event_ids, results
+                            ):
+                                if isinstance(full_data, BaseException):
                                     logger.debug(
                                         "Failed to fetch BetPawa event",
                                         event_id=event_id,
-                                        error=str(e),
+                                        error=str(full_data),
                                     )
-                                return None
-
-                        # Fetch full events only for those without SR ID in list
-                        events_from_full: list[dict] = []
-                        if betpawa_event_ids:
-                            results = await asyncio.gather(
-                                *[
-                                    fetch_full_event(eid, ko)
-                                    for eid, ko in betpawa_event_ids
-                                ],
-                                return_exceptions=True,
-                            )
+                                    continue
 
-                            events_from_full = [
-                                r
-                                for r in results
-                                if r is not None and not isinstance(r, Exception)
-                            ]
+                                # Extract SR ID from widgets array
+                                # BetPawa's widget.id IS the SportRadar ID (8-digit numeric)
+                                sr_id = None
+                                for widget in full_data.get("widgets", []):
+                                    if widget.get("type") == "SPORTRADAR":
+                                        sr_id = widget.get("id")
+                                        if sr_id:
+                                            sr_id = str(sr_id)
+                                        break
+
+                                if sr_id:
+                                    events_from_full.append({
+                                        "sr_id": sr_id,
+                                        "kickoff": kickoff,
+                                        "platform_id": event_id,
+                                    })
 
                         # Combine events from list and full fetch
                         all_events = events_from_list + events_from_full
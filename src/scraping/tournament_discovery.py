@@ -24,6 +24,8 @@ Note:
     country_raw field for future normalization.
 """
 
+import asyncio
+
 import structlog
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -139,6 +141,22 @@ class TournamentDiscoveryService:
         log.info("Starting SportyBet tournament discovery")
 
         data = await client.fetch_tournaments()
+        return await self._store_sportybet_tournaments(data, db)
+
+    async def _store_sportybet_tournaments(
+        self,
+        data: dict,
+        db: AsyncSession,
+    ) -> tuple[int, int]:
+        """Upsert tournaments from a SportyBet tournament tree response.
+
+        Args:
+            data: Response from SportyBetClient.fetch_tournaments().
+            db: Database session.
+
+        Returns:
+            Tuple of (new_count, updated_count).
+        """
         sport_id = await self._get_or_create_football_sport(db)
 
         new_count = 0
@@ -194,6 +212,22 @@ class TournamentDiscoveryService:
         log.info("Starting Bet9ja tournament discovery")
 
         data = await client.fetch_sports()
+        return await self._store_bet9ja_tournaments(data, db)
+
+    async def _store_bet9ja_tournaments(
+        self,
+        data: dict,
+        db: AsyncSession,
+    ) -> tuple[int, int]:
+        """Upsert tournaments from a Bet9ja sports tree response.
+
+        Args:
+            data: Response from Bet9jaClient.fetch_sports().
+            db: Database session.
+
+        Returns:
+            Tuple of (new_count, updated_count).
+        """
         sport_id = await self._get_or_create_football_sport(db)
 
         new_count = 0
@@ -236,6 +270,9 @@ class TournamentDiscoveryService:
     ) -> dict:
         """Discover tournaments from all competitor platforms.
 
+        Both platform API fetches run concurrently; a failure on one platform
+        is recorded in its result entry without affecting the other.
+
         Args:
             sportybet_client: SportyBet API client.
             bet9ja_client: Bet9ja API client.
@@ -255,18 +292,30 @@ class TournamentDiscoveryService:
             "bet9ja": {"new": 0, "updated": 0, "error": None},
         }
 
-        # Discover SportyBet tournaments
+        # Fetch both platform trees concurrently. The DB writes below stay
+        # sequential because they share one AsyncSession.
+        sportybet_data, bet9ja_data = await asyncio.gather(
+            sportybet_client.fetch_tournaments(),
+            bet9ja_client.fetch_sports(),
+            return_exceptions=True,
+        )
+
+        # Store SportyBet tournaments
         try:
-            new_s, upd_s = await self.discover_sportybet_tournaments(sportybet_client, db)
+            if isinstance(sportybet_data, BaseException):
+                raise sportybet_data
+            new_s, upd_s = await self._store_sportybet_tournaments(sportybet_data, db)
             results["sportybet"]["new"] = new_s
             results["sportybet"]["updated"] = upd_s
         except Exception as e:
             log.error("SportyBet tournament discovery failed", error=str(e))
             results["sportybet"]["error"] = str(e)
 
-        # Discover Bet9ja tournaments
+        # Store Bet9ja tournaments
         try:
-            new_b, upd_b = await self.discover_bet9ja_tournaments(bet9ja_client, db)
+            if isinstance(bet9ja_data, BaseException):
+                raise bet9ja_data
+            new_b, upd_b = await self._store_bet9ja_tournaments(bet9ja_data, db)
             results["bet9ja"]["new"] = new_b
             results["bet9ja"]["updated"] = upd_b
         except Exception as e:
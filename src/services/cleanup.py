@@ -316,6 +316,8 @@ async def execute_cleanup(
     odds_days: int,
     match_days: int,
     cleanup_run_id: int | None = None,
+    odds_cutoff: datetime | None = None,
+    match_cutoff: datetime | None = None,
 ) -> CleanupResult:
     """Execute cleanup of old data.
 
@@ -330,6 +332,8 @@ async def execute_cleanup(
         odds_days: Delete odds older than this many days.
         match_days: Delete matches with kickoff older than this many days.
         cleanup_run_id: Optional cleanup run ID for logging.
+        odds_cutoff: Precomputed naive-UTC odds cutoff. Overrides odds_days.
+        match_cutoff: Precomputed naive-UTC match cutoff. Overrides match_days.
 
     Returns:
         CleanupResult with counts of deleted records.
@@ -344,9 +348,12 @@ async def execute_cleanup(
 
     start_time = time.time()
     # Use naive datetime for legacy tables (OddsSnapshot uses TIMESTAMP WITHOUT TIMEZONE)
-    now = datetime.utcnow()
-    odds_cutoff = now - timedelta(days=odds_days)
-    match_cutoff = now - timedelta(days=match_days)
+    if odds_cutoff is None or match_cutoff is None:
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        if odds_cutoff is None:
+            odds_cutoff = now - timedelta(days=odds_days)
+        if match_cutoff is None:
+            match_cutoff = now - timedelta(days=match_days)
 
     # Track oldest dates for reporting
     oldest_odds_result = await session.execute(
@@ -397,7 +404,7 @@ async def execute_cleanup(
 
     # 4.5 Delete old market_odds_history (v2.9 schema - uses timezone-aware datetime)
     log.info("Deleting old market_odds_history")
-    history_cutoff = datetime.now(timezone.utc) - timedelta(days=odds_days)
+    history_cutoff = odds_cutoff.replace(tzinfo=timezone.utc)
     market_odds_history_deleted = await _batch_delete(
         session,
         MarketOddsHistory,
@@ -543,6 +550,8 @@ async def execute_cleanup_with_tracking(
     odds_days: int,
     match_days: int,
     trigger: str = "manual",
+    odds_cutoff: datetime | None = None,
+    match_cutoff: datetime | None = None,
 ) -> tuple[CleanupRun, CleanupResult]:
     """Execute cleanup with run history tracking.
 
@@ -553,6 +562,8 @@ async def execute_cleanup_with_tracking(
         odds_days: Delete odds older than this many days.
         match_days: Delete matches with kickoff older than this many days.
         trigger: Either "scheduled" or "manual".
+        odds_cutoff: Precomputed naive-UTC odds cutoff, passed to execute_cleanup().
+        match_cutoff: Precomputed naive-UTC match cutoff, passed to execute_cleanup().
 
     Returns:
         Tuple of (CleanupRun record, CleanupResult with counts).
@@ -584,6 +595,8 @@ async def execute_cleanup_with_tracking(
             odds_days=odds_days,
             match_days=match_days,
             cleanup_run_id=cleanup_run.id,
+            odds_cutoff=odds_cutoff,
+            match_cutoff=match_cutoff,
         )
 
         # Update cleanup run with results
@@ -0,0 +1,165 @@
+"""Tests for the scrape progress broadcaster."""
+
+import asyncio
+
+from src.scraping.broadcaster import ProgressBroadcaster
+from src.scraping.schemas import ScrapeProgress
+
+
+def _progress(phase: str = "scraping", current: int = 1) -> ScrapeProgress:
+    """Build an overall (platform=None) progress update."""
+    return ScrapeProgress(phase=phase, current=current, total=3)
+
+
+async def _collect(broadcaster: ProgressBroadcaster, into: list) -> None:
+    """Append every update a subscriber receives to into."""
+    async for progress in broadcaster.subscribe():
+        into.append(progress)
+
+
+async def _settle() -> None:
+    """Let subscriber tasks run until they block again."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestPublish:
+    """Tests for ProgressBroadcaster.publish()."""
+
+    def test_publish_without_subscribers_updates_slot(self):
+        """Test publishing with no subscribers stores the latest update."""
+
+        async def scenario():
+            broadcaster = ProgressBroadcaster(1)
+            first, second = _progress(current=1), _progress(current=2)
+            await broadcaster.publish(first)
+            await broadcaster.publish(second)
+            return broadcaster, second
+
+        broadcaster, second = asyncio.run(scenario())
+        assert broadcaster.latest_progress is second
+        assert broadcaster.subscriber_count == 0
+        assert not broadcaster.is_completed
+
+    def test_terminal_publish_without_subscribers_completes(self):
+        """Test a terminal update completes the run with nobody watching."""
+
+        async def scenario():
+            broadcaster = ProgressBroadcaster(1)
+            await broadcaster.publish(_progress("completed", current=3))
+            return broadcaster.is_completed
+
+        assert asyncio.run(scenario())
+
+    def test_on_complete_fires_exactly_once(self):
+        """Test on_complete runs once across terminal update and close()."""
+
+        async def scenario():
+            completed: list[int] = []
+            broadcaster = ProgressBroadcaster(7, on_complete=completed.append)
+            await broadcaster.publish(_progress())
+            await broadcaster.publish(_progress("failed", current=0))
+            await broadcaster.close()
+            await broadcaster.close()
+            return completed
+
+        assert asyncio.run(scenario()) == [7]
+
+    def test_close_fires_on_complete_without_terminal_update(self):
+        """Test close() completes a run that never published a terminal update."""
+
+        async def scenario():
+            completed: list[int] = []
+            broadcaster = ProgressBroadcaster(7, on_complete=completed.append)
+            await broadcaster.publish(_progress())
+            await broadcaster.close()
+            return completed
+
+        assert asyncio.run(scenario()) == [7]
+
+
+class TestSubscribe:
+    """Tests for ProgressBroadcaster.subscribe()."""
+
+    def test_late_subscriber_catches_up_from_latest(self):
+        """Test a subscriber joining mid-run first receives the latest update."""
+
+        async def scenario():
+            broadcaster = ProgressBroadcaster(1)
+            await broadcaster.publish(_progress(current=1))
+            latest = _progress(current=2)
+            await broadcaster.publish(latest)
+
+            received: list[ScrapeProgress] = []
+            subscriber = asyncio.create_task(_collect(broadcaster, received))
+            await _settle()
+            caught_up = list(received)
+
+            terminal = _progress("completed", current=3)
+            await broadcaster.publish(terminal)
+            await subscriber
+            return latest, terminal, caught_up, received, broadcaster
+
+        latest, terminal, caught_up, received, broadcaster = asyncio.run(
+            scenario()
+        )
+        assert caught_up == [latest]
+        assert received == [latest, terminal]
+        assert broadcaster.subscriber_count == 0
+
+    def test_lagging_subscriber_skips_to_newest(self):
+        """Test a burst of updates is delivered as the newest one only."""
+
+        async def scenario():
+            broadcaster = ProgressBroadcaster(1)
+            received: list[ScrapeProgress] = []
+            subscriber = asyncio.create_task(_collect(broadcaster, received))
+            await _settle()
+
+            burst = [_progress(current=i) for i in range(3)]
+            for progress in burst:
+                await broadcaster.publish(progress)
+            await _settle()
+            after_burst = list(received)
+
+            await broadcaster.publish(_progress("completed", current=3))
+            await subscriber
+            return burst, after_burst
+
+        burst, after_burst = asyncio.run(scenario())
+        assert after_burst == [burst[-1]]
+
+    def test_terminal_update_delivered_before_close(self):
+        """Test a terminal update published right before close() is delivered."""
+
+        async def scenario():
+            broadcaster = ProgressBroadcaster(1)
+            received: list[ScrapeProgress] = []
+            subscriber = asyncio.create_task(_collect(broadcaster, received))
+            await _settle()
+
+            await broadcaster.publish(_progress(current=1))
+            terminal = _progress("failed", current=0)
+            await broadcaster.publish(terminal)
+            await broadcaster.close()
+            await asyncio.wait_for(subscriber, timeout=1.0)
+            return terminal, received
+
+        terminal, received = asyncio.run(scenario())
+        assert received[-1] is terminal
+
+    def test_close_ends_idle_subscriber(self):
+        """Test close() ends a subscriber that has nothing new to deliver."""
+
+        async def scenario():
+            broadcaster = ProgressBroadcaster(1)
+            received: list[ScrapeProgress] = []
+            subscriber = asyncio.create_task(_collect(broadcaster, received))
+            await _settle()
+            await broadcaster.close()
+            await asyncio.wait_for(subscriber, timeout=1.0)
+            return received, broadcaster.subscriber_count
+
+        received, subscriber_count = asyncio.run(scenario())
+        assert received == []
+        assert subscriber_count == 0
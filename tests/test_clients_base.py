@@ -0,0 +1,462 @@
+"""Tests for shared scraper client helpers."""
+
+import asyncio
+import email.utils
+import time
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from src.scraping.clients import base
+from src.scraping.clients.base import (
+    _RESPONSE_CACHE_PRUNE_AT,
+    RETRY_AFTER_MAX_WAIT,
+    RETRY_MAX_WAIT,
+    _retry_after,
+    _retry_wait,
+    circuit_breaker,
+    create_retry_decorator,
+    response_cache,
+)
+from src.scraping.exceptions import ApiError, NetworkError
+
+_REQUEST = httpx.Request("GET", "https://example.test/event")
+
+
+def _status_error(
+    status_code: int, retry_after: str | None = None
+) -> httpx.HTTPStatusError:
+    """Build an HTTPStatusError for the given response status."""
+    headers = {"Retry-After": retry_after} if retry_after is not None else None
+    response = httpx.Response(status_code, headers=headers, request=_REQUEST)
+    return httpx.HTTPStatusError(
+        f"HTTP {status_code}", request=_REQUEST, response=response
+    )
+
+
+def _http_date(offset_seconds: float) -> str:
+    """Format now + offset_seconds as an RFC 9110 HTTP-date."""
+    when = datetime.now(timezone.utc) + timedelta(seconds=offset_seconds)
+    return email.utils.format_datetime(when, usegmt=True)
+
+
+class TestRetryWait:
+    """Tests for _retry_wait function."""
+
+    @pytest.mark.parametrize(
+        "attempt,ceiling",
+        [(1, 0.2), (2, 0.4), (3, 0.8), (4, 1.6), (5, 2.0), (8, 2.0)],
+    )
+    def test_ceiling_grows_exponentially_and_is_capped(
+        self, monkeypatch, attempt, ceiling
+    ):
+        """Test the jitter ceiling doubles per attempt up to RETRY_MAX_WAIT."""
+        monkeypatch.setattr(base.random, "uniform", lambda low, high: (low, high))
+        assert _retry_wait(attempt) == (0, pytest.approx(ceiling))
+
+    def test_wait_is_within_ceiling(self):
+        """Test sampled waits stay between zero and the ceiling."""
+        waits = [_retry_wait(10) for _ in range(200)]
+        assert all(0 <= wait <= RETRY_MAX_WAIT for wait in waits)
+        assert len(set(waits)) > 1
+
+
+class TestRetryAfter:
+    """Tests for _retry_after function."""
+
+    @pytest.mark.parametrize("status_code", [429, 503])
+    def test_delta_seconds(self, status_code):
+        """Test an integer Retry-After is used as seconds."""
+        assert _retry_after(_status_error(status_code, "3")) == 3.0
+
+    def test_fractional_seconds(self):
+        """Test a fractional Retry-After is accepted."""
+        assert _retry_after(_status_error(429, "0.5")) == 0.5
+
+    def test_delta_seconds_capped(self):
+        """Test long delays are capped at RETRY_AFTER_MAX_WAIT."""
+        assert _retry_after(_status_error(429, "120")) == RETRY_AFTER_MAX_WAIT
+
+    def test_negative_delta_clamped_to_zero(self):
+        """Test a negative Retry-After means retry immediately."""
+        assert _retry_after(_status_error(429, "-5")) == 0.0
+
+    def test_http_date(self):
+        """Test an HTTP-date Retry-After is converted to a delay from now."""
+        delay = _retry_after(_status_error(503, _http_date(5)))
+        assert 3.0 <= delay <= 5.0
+
+    def test_http_date_capped(self):
+        """Test a far-future HTTP-date is capped at RETRY_AFTER_MAX_WAIT."""
+        delay = _retry_after(_status_error(503, _http_date(3600)))
+        assert delay == RETRY_AFTER_MAX_WAIT
+
+    def test_past_http_date_clamped_to_zero(self):
+        """Test an HTTP-date in the past means retry immediately."""
+        assert _retry_after(_status_error(503, _http_date(-60))) == 0.0
+
+    @pytest.mark.parametrize("value", [None, "", "soon", "nan", "inf"])
+    def test_missing_or_garbage_header(self, value):
+        """Test unusable Retry-After values yield None."""
+        assert _retry_after(_status_error(429, value)) is None
+
+    def test_other_status_ignored(self):
+        """Test Retry-After is only honoured on 429 and 503."""
+        assert _retry_after(_status_error(500, "3")) is None
+
+    def test_non_http_error_ignored(self):
+        """Test transport errors have no server-requested delay."""
+        assert _retry_after(httpx.ConnectError("refused")) is None
+
+
+class TestRetryDecorator:
+    """Tests for the retry decorator's choice of delay."""
+
+    @staticmethod
+    def _retried(errors: list[Exception]):
+        """Build a retried function raising each error in turn, then succeeding."""
+
+        @create_retry_decorator()
+        async def fetch() -> str:
+            if errors:
+                raise errors.pop(0)
+            return "ok"
+
+        return fetch
+
+    def test_garbage_retry_after_falls_back_to_jitter(self, monkeypatch):
+        """Test an unusable Retry-After falls back to the jittered wait."""
+        attempts: list[int] = []
+
+        def fake_wait(attempt: int) -> float:
+            attempts.append(attempt)
+            return 0.0
+
+        monkeypatch.setattr(base, "_retry_wait", fake_wait)
+        fetch = self._retried([_status_error(429, "soon"), _status_error(503)])
+        assert asyncio.run(fetch()) == "ok"
+        assert attempts == [1, 2]
+
+    def test_retry_after_replaces_jitter(self, monkeypatch):
+        """Test a usable Retry-After is used instead of the jittered wait."""
+        attempts: list[int] = []
+        monkeypatch.setattr(base, "_retry_wait", attempts.append)
+        fetch = self._retried([_status_error(429, "0")])
+        assert asyncio.run(fetch()) == "ok"
+        assert attempts == []
+
+
+class _FlakyEndpoint:
+    """Callable whose next outcome is set by the test."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.error: BaseException | None = None
+        self.gate: asyncio.Event | None = None
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return "ok"
+
+
+def _guarded(
+    endpoint: _FlakyEndpoint, threshold: int = 3, reset_timeout: float = 0.05
+):
+    """Wrap endpoint in a fresh circuit breaker."""
+
+    @circuit_breaker(threshold=threshold, reset_timeout=reset_timeout)
+    async def fetch() -> str:
+        return await endpoint()
+
+    return fetch
+
+
+async def _call_ignoring(fetch, *errors: type[BaseException]) -> None:
+    """Call fetch and swallow the expected error types."""
+    try:
+        await fetch()
+    except errors:
+        pass
+
+
+class TestCircuitBreaker:
+    """Tests for the circuit_breaker decorator."""
+
+    def test_opens_after_threshold_network_errors(self):
+        """Test consecutive NetworkErrors open the circuit and fail fast."""
+
+        async def scenario():
+            endpoint = _FlakyEndpoint()
+            endpoint.error = NetworkError("down")
+            fetch = _guarded(endpoint)
+            for _ in range(3):
+                await _call_ignoring(fetch, NetworkError)
+            with pytest.raises(NetworkError, match="circuit open"):
+                await fetch()
+            return endpoint.calls
+
+        assert asyncio.run(scenario()) == 3
+
+    @pytest.mark.parametrize("status_code", [500, 503, 429])
+    def test_server_errors_and_rate_limits_count(self, status_code):
+        """Test 5xx and 429 responses count as failures."""
+
+        async def scenario():
+            endpoint = _FlakyEndpoint()
+            endpoint.error = _status_error(status_code)
+            fetch = _guarded(endpoint)
+            for _ in range(3):
+                await _call_ignoring(fetch, httpx.HTTPStatusError)
+            with pytest.raises(NetworkError, match="circuit open"):
+                await fetch()
+
+        asyncio.run(scenario())
+
+    @pytest.mark.parametrize(
+        "error", [_status_error(404), _status_error(400), ApiError("bad body")]
+    )
+    def test_client_errors_do_not_count(self, error):
+        """Test 4xx (other than 429) and ApiError keep the circuit closed."""
+
+        async def scenario():
+            endpoint = _FlakyEndpoint()
+            endpoint.error = error
+            fetch = _guarded(endpoint)
+            for _ in range(5):
+                await _call_ignoring(fetch, type(error))
+            return endpoint.calls
+
+        assert asyncio.run(scenario()) == 5
+
+    def test_success_resets_failure_count(self):
+        """Test only consecutive failures open the circuit."""
+
+        async def scenario():
+            endpoint = _FlakyEndpoint()
+            fetch = _guarded(endpoint)
+            for _ in range(2):
+                endpoint.error = NetworkError("down")
+                await _call_ignoring(fetch, NetworkError)
+                endpoint.error = None
+                await fetch()
+            endpoint.error = NetworkError("down")
+            for _ in range(2):
+                await _call_ignoring(fetch, NetworkError)
+            endpoint.error = None
+            return await fetch()
+
+        assert asyncio.run(scenario()) == "ok"
+
+    def test_half_open_probe_success_closes(self):
+        """Test a successful probe after reset_timeout closes the circuit."""
+
+        async def scenario():
+            endpoint = _FlakyEndpoint()
+            endpoint.error = NetworkError("down")
+            fetch = _guarded(endpoint, reset_timeout=0.01)
+            for _ in range(3):
+                await _call_ignoring(fetch, NetworkError)
+            time.sleep(0.02)
+            endpoint.error = None
+            assert await fetch() == "ok"
+            # Closed again: every call reaches the endpoint
+            await fetch()
+            return endpoint.calls
+
+        assert asyncio.run(scenario()) == 5
+
+    def test_half_open_probe_failure_reopens(self):
+        """Test a failed probe re-opens the circuit for another timeout."""
+
+        async def scenario():
+            endpoint = _FlakyEndpoint()
+            endpoint.error = NetworkError("down")
+            fetch = _guarded(endpoint, reset_timeout=0.01)
+            for _ in range(3):
+                await _call_ignoring(fetch, NetworkError)
+            time.sleep(0.02)
+            with pytest.raises(NetworkError, match="down"):
+                await fetch()
+            with pytest.raises(NetworkError, match="circuit open"):
+                await fetch()
+            return endpoint.calls
+
+        assert asyncio.run(scenario()) == 4
+
+    def test_half_open_admits_single_probe(self):
+        """Test calls during an in-flight probe fail fast."""
+
+        async def scenario():
+            endpoint = _FlakyEndpoint()
+            endpoint.error = NetworkError("down")
+            fetch = _guarded(endpoint, reset_timeout=0.01)
+            for _ in range(3):
+                await _call_ignoring(fetch, NetworkError)
+            time.sleep(0.02)
+            endpoint.error = None
+            endpoint.gate = asyncio.Event()
+            probe = asyncio.create_task(fetch())
+            await asyncio.sleep(0)
+            with pytest.raises(NetworkError, match="circuit open"):
+                await fetch()
+            endpoint.gate.set()
+            return await probe
+
+        assert asyncio.run(scenario()) == "ok"
+
+    def test_cancelled_probe_releases_half_open_slot(self):
+        """Test a cancelled probe lets the next call probe instead."""
+
+        async def scenario():
+            endpoint = _FlakyEndpoint()
+            endpoint.error = NetworkError("down")
+            fetch = _guarded(endpoint, reset_timeout=0.01)
+            for _ in range(3):
+                await _call_ignoring(fetch, NetworkError)
+            time.sleep(0.02)
+            endpoint.error = None
+            endpoint.gate = asyncio.Event()
+            probe = asyncio.create_task(fetch())
+            await asyncio.sleep(0)
+            probe.cancel()
+            await _call_ignoring(lambda: probe, asyncio.CancelledError)
+            endpoint.gate = None
+            return await fetch()
+
+        assert asyncio.run(scenario()) == "ok"
+
+
+class _CachedClient:
+    """Client stub whose fetch_event goes through response_cache."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.error: BaseException | None = None
+        self.gate: asyncio.Event | None = None
+
+    async def _fetch(self, event_id: str) -> dict:
+        self.calls.append(event_id)
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return {"id": event_id}
+
+    @response_cache(ttl=60.0)
+    async def fetch_event(self, event_id: str) -> dict:
+        return await self._fetch(event_id)
+
+
+class _ShortTtlClient(_CachedClient):
+    """Client stub whose cached results expire almost immediately."""
+
+    @response_cache(ttl=0.01)
+    async def fetch_event(self, event_id: str) -> dict:
+        return await self._fetch(event_id)
+
+
+class TestResponseCache:
+    """Tests for the response_cache decorator."""
+
+    def test_repeat_call_within_ttl_returns_shared_result(self):
+        """Test a cached result is returned as the same (read-only) object."""
+
+        async def scenario():
+            client = _CachedClient()
+            first = await client.fetch_event("1")
+            second = await client.fetch_event("1")
+            return client.calls, first, second
+
+        calls, first, second = asyncio.run(scenario())
+        assert calls == ["1"]
+        assert second is first
+
+    def test_expired_entry_is_refetched(self):
+        """Test a result older than the TTL triggers a new fetch."""
+
+        async def scenario():
+            client = _ShortTtlClient()
+            await client.fetch_event("1")
+            await asyncio.sleep(0.02)
+            await client.fetch_event("1")
+            return client.calls
+
+        assert asyncio.run(scenario()) == ["1", "1"]
+
+    def test_concurrent_calls_share_one_fetch(self):
+        """Test concurrent callers for one key coalesce into a single fetch."""
+
+        async def scenario():
+            client = _CachedClient()
+            client.gate = asyncio.Event()
+            callers = [
+                asyncio.create_task(client.fetch_event("1")) for _ in range(5)
+            ]
+            await asyncio.sleep(0)
+            client.gate.set()
+            results = await asyncio.gather(*callers)
+            return client.calls, results
+
+        calls, results = asyncio.run(scenario())
+        assert calls == ["1"]
+        assert all(result is results[0] for result in results)
+
+    def test_failures_are_not_cached(self):
+        """Test a failed fetch is retried by the next caller."""
+
+        async def scenario():
+            client = _CachedClient()
+            client.error = NetworkError("down")
+            with pytest.raises(NetworkError):
+                await client.fetch_event("1")
+            client.error = None
+            result = await client.fetch_event("1")
+            return client.calls, result
+
+        calls, result = asyncio.run(scenario())
+        assert calls == ["1", "1"]
+        assert result == {"id": "1"}
+
+    def test_cancelled_caller_does_not_cancel_shared_fetch(self):
+        """Test the shared fetch survives one of its callers being cancelled."""
+
+        async def scenario():
+            client = _CachedClient()
+            client.gate = asyncio.Event()
+            cancelled = asyncio.create_task(client.fetch_event("1"))
+            waiting = asyncio.create_task(client.fetch_event("1"))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            await asyncio.sleep(0)
+            client.gate.set()
+            result = await waiting
+            cached = await client.fetch_event("1")
+            return cancelled.cancelled(), client.calls, result, cached
+
+        was_cancelled, calls, result, cached = asyncio.run(scenario())
+        assert was_cancelled
+        assert calls == ["1"]
+        assert result == {"id": "1"}
+        assert cached is result
+
+    def test_expired_entries_pruned_past_limit(self):
+        """Test expired entries are dropped once the cache reaches its limit."""
+
+        async def scenario():
+            client = _ShortTtlClient()
+            for i in range(_RESPONSE_CACHE_PRUNE_AT):
+                await client.fetch_event(str(i))
+            cache = client.__dict__["_fetch_event_cache"]
+            full = len(cache._entries)
+            await asyncio.sleep(0.02)
+            await client.fetch_event("new")
+            return full, list(cache._entries)
+
+        full, remaining = asyncio.run(scenario())
+        assert full == _RESPONSE_CACHE_PRUNE_AT
+        assert remaining == ["new"]
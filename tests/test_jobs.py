@@ -0,0 +1,79 @@
+"""Tests for scheduled job helpers."""
+
+import asyncio
+import time
+from datetime import timedelta
+
+from src.scheduling import jobs
+from src.scheduling.jobs import CLEANUP_RETRY_DELAY, JobContext
+from src.scheduling.timeutil import utcnow
+
+
+def _context() -> JobContext:
+    """Job context that needs no database: seeded, with no Settings row."""
+    ctx = JobContext()
+    ctx.cleanup_seeded = True
+    ctx.settings_cache = (time.monotonic(), None)
+    return ctx
+
+
+class TestMaybeLaunchCleanup:
+    """Tests for _maybe_launch_cleanup function."""
+
+    def test_failed_cleanup_backs_off(self, monkeypatch):
+        """Test a failing cleanup is not relaunched on the next scrape tick."""
+        launches: list[JobContext] = []
+
+        async def failing_cleanup(ctx: JobContext) -> None:
+            launches.append(ctx)
+            raise RuntimeError("lock timeout")
+
+        monkeypatch.setattr(jobs, "cleanup_old_data", failing_cleanup)
+
+        async def scenario():
+            ctx = _context()
+            await jobs._maybe_launch_cleanup(ctx)
+            await asyncio.gather(ctx.cleanup_task, return_exceptions=True)
+            await jobs._maybe_launch_cleanup(ctx)
+            return ctx
+
+        ctx = asyncio.run(scenario())
+        assert len(launches) == 1
+        assert ctx.last_cleanup_at is None
+        assert ctx.cleanup_retry_at > utcnow() + CLEANUP_RETRY_DELAY / 2
+
+    def test_relaunched_after_retry_delay(self, monkeypatch):
+        """Test cleanup is launched again once the retry delay has passed."""
+        launches: list[JobContext] = []
+
+        async def cleanup(ctx: JobContext) -> None:
+            launches.append(ctx)
+
+        monkeypatch.setattr(jobs, "cleanup_old_data", cleanup)
+
+        async def scenario():
+            ctx = _context()
+            ctx.cleanup_retry_at = utcnow() - timedelta(seconds=1)
+            await jobs._maybe_launch_cleanup(ctx)
+            await ctx.cleanup_task
+
+        asyncio.run(scenario())
+        assert len(launches) == 1
+
+    def test_recent_success_not_relaunched(self, monkeypatch):
+        """Test cleanup waits for cleanup_frequency_hours after a success."""
+        launches: list[JobContext] = []
+
+        async def cleanup(ctx: JobContext) -> None:
+            launches.append(ctx)
+
+        monkeypatch.setattr(jobs, "cleanup_old_data", cleanup)
+
+        async def scenario():
+            ctx = _context()
+            ctx.last_cleanup_at = utcnow() - timedelta(hours=1)
+            await jobs._maybe_launch_cleanup(ctx)
+            return ctx.cleanup_task
+
+        assert asyncio.run(scenario()) is None
+        assert launches == []
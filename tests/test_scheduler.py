@@ -0,0 +1,354 @@
+"""Tests for the PeriodicRunner interval scheduler."""
+
+import asyncio
+import importlib
+import time
+from datetime import timedelta
+
+import pytest
+
+from src.scheduling.scheduler import JobLookupError, PeriodicRunner
+
+# The package re-exports the runner instance as "scheduler", shadowing the module
+scheduler_module = importlib.import_module("src.scheduling.scheduler")
+
+# Short interval so real-time tests finish quickly
+TICK = timedelta(seconds=0.02)
+
+
+class _CountingJob:
+    """Coroutine function that counts calls and optionally blocks."""
+
+    def __init__(self, block: bool = False) -> None:
+        self.calls = 0
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+        self.finished = False
+        if not block:
+            self.release.set()
+
+    async def __call__(self) -> None:
+        self.calls += 1
+        self.started.set()
+        await self.release.wait()
+        self.finished = True
+
+
+class TestRunning:
+    """Tests for launching jobs on their deadlines."""
+
+    def test_job_runs_after_one_interval(self):
+        """Test a job's first run is one interval after add_job()."""
+
+        async def scenario():
+            runner = PeriodicRunner()
+            job = _CountingJob()
+            runner.add_job(job, interval=TICK, id="job")
+            runner.start()
+            await asyncio.wait_for(job.started.wait(), timeout=1.0)
+            await runner.shutdown()
+            return job.calls
+
+        assert asyncio.run(scenario()) >= 1
+
+    def test_skips_tick_while_previous_run_in_progress(self):
+        """Test at most one run of a job is in flight at a time."""
+
+        async def scenario():
+            runner = PeriodicRunner()
+            job = _CountingJob(block=True)
+            runner.add_job(job, interval=TICK, id="job")
+            runner.start()
+            await asyncio.wait_for(job.started.wait(), timeout=1.0)
+            # Several ticks pass while the first run is blocked
+            await asyncio.sleep(TICK.total_seconds() * 5)
+            calls = job.calls
+            job.release.set()
+            await runner.shutdown()
+            return calls
+
+        assert asyncio.run(scenario()) == 1
+
+    def test_missed_ticks_coalesce_into_one_run(self):
+        """Test a job several intervals behind runs once, then jumps ahead."""
+
+        async def scenario():
+            runner = PeriodicRunner()
+            job = _CountingJob()
+            runner.add_job(job, interval=timedelta(seconds=10), id="job")
+            periodic_job = runner.get_jobs()[0]
+            missed_deadline = time.monotonic() - 35.0
+            periodic_job.next_run_at = missed_deadline
+            runner._push(periodic_job)
+            runner.start()
+            await asyncio.wait_for(job.started.wait(), timeout=1.0)
+            await asyncio.sleep(0)
+            next_run_at = periodic_job.next_run_at
+            await runner.shutdown()
+            return job.calls, missed_deadline, next_run_at
+
+        calls, missed_deadline, next_run_at = asyncio.run(scenario())
+        assert calls == 1
+        # First deadline still ahead, on the original 10s grid
+        assert next_run_at == missed_deadline + 40.0
+        assert next_run_at > time.monotonic()
+
+    def test_deadline_advances_from_schedule_not_now(self):
+        """Test the next deadline is the previous one plus the interval."""
+
+        async def scenario():
+            runner = PeriodicRunner()
+            job = _CountingJob()
+            runner.add_job(job, interval=TICK, id="job")
+            periodic_job = runner.get_jobs()[0]
+            first_deadline = periodic_job.next_run_at
+            runner.start()
+            await asyncio.wait_for(job.started.wait(), timeout=1.0)
+            await asyncio.sleep(0)
+            next_run_at = periodic_job.next_run_at
+            await runner.shutdown()
+            return first_deadline, next_run_at
+
+        first_deadline, next_run_at = asyncio.run(scenario())
+        assert next_run_at == first_deadline + TICK.total_seconds()
+
+
+class TestReschedule:
+    """Tests for PeriodicRunner.reschedule_job()."""
+
+    def test_reschedule_changes_interval_and_deadline(self):
+        """Test a new interval moves the next run one new interval away."""
+
+        async def scenario():
+            runner = PeriodicRunner()
+            runner.add_job(_CountingJob(), interval=timedelta(hours=1), id="job")
+            before = time.monotonic()
+            runner.reschedule_job("job", interval=timedelta(minutes=5))
+            job = runner.get_jobs()[0]
+            return before, job.interval_seconds, job.next_run_at
+
+        before, interval_seconds, next_run_at = asyncio.run(scenario())
+        assert interval_seconds == 300.0
+        assert before + 300.0 <= next_run_at < before + 301.0
+
+    def test_reschedule_same_interval_is_noop(self):
+        """Test rescheduling to the current interval keeps the deadline."""
+
+        async def scenario():
+            runner = PeriodicRunner()
+            runner.add_job(_CountingJob(), interval=timedelta(minutes=5), id="job")
+            job = runner.get_jobs()[0]
+            deadline = job.next_run_at
+            heap_size = len(runner._heap)
+            runner.reschedule_job("job", interval=timedelta(minutes=5))
+            return deadline, job.next_run_at, heap_size, len(runner._heap)
+
+        deadline, next_run_at, heap_before, heap_after = asyncio.run(scenario())
+        assert next_run_at == deadline
+        assert heap_after == heap_before
+
+    def test_reschedule_unknown_job_raises(self):
+        """Test rescheduling an unregistered id raises JobLookupError."""
+
+        async def scenario():
+            runner = PeriodicRunner()
+            runner.reschedule_job("missing", interval=timedelta(minutes=5))
+
+        with pytest.raises(JobLookupError):
+            asyncio.run(scenario())
+
+    def test_job_lookup_error_is_key_error(self):
+        """Test JobLookupError can be caught as KeyError."""
+        assert issubclass(JobLookupError, KeyError)
+
+    def test_reschedule_wakes_driver(self):
+        """Test a shorter interval takes effect without waiting out the old one."""
+
+        async def scenario():
+            runner = PeriodicRunner()
+            job = _CountingJob()
+            runner.add_job(job, interval=timedelta(hours=1), id="job")
+            runner.start()
+            await asyncio.sleep(0)
+            runner.reschedule_job("job", interval=TICK)
+            await asyncio.wait_for(job.started.wait(), timeout=1.0)
+            await runner.shutdown()
+            return job.calls
+
+        assert asyncio.run(scenario()) >= 1
+
+
+class TestPauseResume:
+    """Tests for PeriodicRunner.pause() and resume()."""
+
+    def test_paused_runner_skips_runs_and_resumes(self):
+        """Test no runs launch while paused and runs continue after resume."""
+
+        async def scenario():
+            runner = PeriodicRunner()
+            job = _CountingJob()
+            runner.add_job(job, interval=TICK, id="job")
+            periodic_job = runner.get_jobs()[0]
+            first_deadline = periodic_job.next_run_at
+            runner.pause()
+            runner.start()
+            await asyncio.sleep(TICK.total_seconds() * 5)
+            paused_calls = job.calls
+            advanced = periodic_job.next_run_at > first_deadline
+            runner.resume()
+            await asyncio.wait_for(job.started.wait(), timeout=1.0)
+            await runner.shutdown()
+            return paused_calls, advanced, job.calls
+
+        paused_calls, advanced, calls = asyncio.run(scenario())
+        assert paused_calls == 0
+        assert advanced  # Ticks keep advancing while paused
+        assert calls >= 1
+
+
+class TestShutdown:
+    """Tests for PeriodicRunner.shutdown()."""
+
+    def test_shutdown_waits_for_in_flight_run(self):
+        """Test shutdown(wait=True) lets a running job finish."""
+
+        async def scenario():
+            runner = PeriodicRunner()
+            job = _CountingJob(block=True)
+            runner.add_job(job, interval=TICK, id="job")
+            runner.start()
+            await asyncio.wait_for(job.started.wait(), timeout=1.0)
+            asyncio.get_running_loop().call_later(0.05, job.release.set)
+            await runner.shutdown(wait=True)
+            return job.finished, runner.running
+
+        finished, running = asyncio.run(scenario())
+        assert finished
+        assert not running
+
+    def test_shutdown_without_wait_cancels_in_flight_run(self):
+        """Test shutdown(wait=False) cancels a running job."""
+
+        async def scenario():
+            runner = PeriodicRunner()
+            job = _CountingJob(block=True)
+            runner.add_job(job, interval=TICK, id="job")
+            runner.start()
+            await asyncio.wait_for(job.started.wait(), timeout=1.0)
+            task = runner.get_jobs()[0].task
+            await runner.shutdown(wait=False)
+            return job.finished, task.cancelled()
+
+        finished, cancelled = asyncio.run(scenario())
+        assert not finished
+        assert cancelled
+
+
+class TestIntervalValidation:
+    """Tests for rejecting non-positive job intervals."""
+
+    @pytest.mark.parametrize("seconds", [0, -60])
+    def test_add_job_rejects_non_positive_interval(self, seconds):
+        """Test add_job() refuses an interval the driver cannot advance by."""
+        runner = PeriodicRunner()
+        with pytest.raises(ValueError):
+            runner.add_job(
+                _CountingJob(), interval=timedelta(seconds=seconds), id="job"
+            )
+        assert runner.get_jobs() == []
+
+    @pytest.mark.parametrize("seconds", [0, -60])
+    def test_reschedule_rejects_non_positive_interval(self, seconds):
+        """Test reschedule_job() keeps the old interval on a bad value."""
+        runner = PeriodicRunner()
+        runner.add_job(_CountingJob(), interval=timedelta(minutes=5), id="job")
+        with pytest.raises(ValueError):
+            runner.reschedule_job("job", interval=timedelta(seconds=seconds))
+        assert runner.get_jobs()[0].interval_seconds == 300.0
+
+
+class TestSyncSettingsOnStartup:
+    """Tests for SCRAPE_INTERVAL_MINUTES handling at startup."""
+
+    @pytest.fixture
+    def runner(self, monkeypatch):
+        """Module scheduler replaced by a fresh runner with the scrape job."""
+        runner = PeriodicRunner()
+        runner.add_job(
+            _CountingJob(),
+            interval=timedelta(minutes=scheduler_module.DEFAULT_INTERVAL_MINUTES),
+            id="scrape_all_platforms",
+        )
+        monkeypatch.setattr(scheduler_module, "scheduler", runner)
+
+        async def no_settings():
+            return None
+
+        monkeypatch.setattr(scheduler_module, "get_settings_from_db", no_settings)
+        return runner
+
+    @pytest.mark.parametrize("value", ["1", "15", "60"])
+    def test_valid_env_interval_applied(self, runner, monkeypatch, value):
+        """Test an in-range SCRAPE_INTERVAL_MINUTES reschedules the scrape job."""
+        monkeypatch.setenv("SCRAPE_INTERVAL_MINUTES", value)
+        asyncio.run(scheduler_module.sync_settings_on_startup())
+        assert runner.get_jobs()[0].interval_seconds == int(value) * 60
+
+    @pytest.mark.parametrize("value", ["0", "-5", "61", "five"])
+    def test_invalid_env_interval_ignored(self, runner, monkeypatch, value):
+        """Test out-of-range or non-numeric values keep the default interval."""
+        monkeypatch.setenv("SCRAPE_INTERVAL_MINUTES", value)
+        asyncio.run(scheduler_module.sync_settings_on_startup())
+        expected = scheduler_module.DEFAULT_INTERVAL_MINUTES * 60
+        assert runner.get_jobs()[0].interval_seconds == expected
+
+
+class TestDriverCrash:
+    """Tests for surfacing a crashed driver task."""
+
+    def test_driver_crash_is_logged(self, monkeypatch, caplog):
+        """Test an exception escaping the driver loop is logged."""
+
+        async def crash() -> None:
+            raise RuntimeError("driver bug")
+
+        async def scenario():
+            runner = PeriodicRunner()
+            monkeypatch.setattr(runner, "_run", crash)
+            runner.start()
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            return runner.running
+
+        with caplog.at_level("CRITICAL", logger="src.scheduling.scheduler"):
+            running = asyncio.run(scenario())
+        assert not running
+        assert "Scheduler driver stopped" in caplog.text
+
+
+class TestCancelCleanup:
+    """Tests for cancelling the scrape-launched cleanup on shutdown."""
+
+    def test_running_cleanup_is_cancelled(self):
+        """Test a cleanup task still running is cancelled and forgotten."""
+        from src.scheduling.jobs import JobContext, cancel_cleanup
+
+        async def scenario():
+            ctx = JobContext()
+            ctx.cleanup_task = asyncio.create_task(asyncio.sleep(60))
+            task = ctx.cleanup_task
+            await asyncio.sleep(0)
+            await cancel_cleanup(ctx)
+            return task.cancelled(), ctx.cleanup_task
+
+        cancelled, remaining = asyncio.run(scenario())
+        assert cancelled
+        assert remaining is None
+
+    def test_no_cleanup_is_noop(self):
+        """Test cancelling with no cleanup task does nothing."""
+        from src.scheduling.jobs import JobContext, cancel_cleanup
+
+        ctx = JobContext()
+        asyncio.run(cancel_cleanup(ctx))
+        assert ctx.cleanup_task is None
@@ -0,0 +1,43 @@
+"""Tests for SportyBet client HTTP status handling."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.scraping.clients.sportybet import SportyBetClient
+from src.scraping.exceptions import InvalidEventIdError, NetworkError
+
+
+def _fetch_with_status(status_code: int) -> BaseException | dict:
+    """Fetch one event from a mock SportyBet answering status_code."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status_code, json={})
+
+    async def scenario():
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            client = SportyBetClient(http_client)
+            try:
+                return await client.fetch_event("sr:match:1")
+            except Exception as e:
+                return e
+
+    return asyncio.run(scenario())
+
+
+class TestFetchEventStatus:
+    """Tests for mapping non-200 statuses in SportyBetClient.fetch_event."""
+
+    @pytest.mark.parametrize("status_code", [400, 404, 410])
+    def test_unknown_event_statuses(self, status_code):
+        """Test statuses about the event ID raise InvalidEventIdError."""
+        result = _fetch_with_status(status_code)
+        assert isinstance(result, InvalidEventIdError)
+
+    @pytest.mark.parametrize("status_code", [401, 403, 451])
+    def test_blocking_statuses(self, status_code):
+        """Test block/geo-fence statuses raise NetworkError for the breaker."""
+        result = _fetch_with_status(status_code)
+        assert isinstance(result, NetworkError)
@@ -0,0 +1,74 @@
+"""Tests for stale scrape run detection helpers."""
+
+from datetime import datetime, timedelta, timezone
+
+from src.scheduling.stale_detection import _as_naive_utc, _stale_message
+
+NOW = datetime(2026, 1, 15, 12, 0, 0)
+
+
+class TestAsNaiveUtc:
+    """Tests for _as_naive_utc function."""
+
+    def test_naive_datetime_unchanged(self):
+        """Test naive datetimes are assumed UTC and returned as-is."""
+        assert _as_naive_utc(NOW) is NOW
+
+    def test_aware_utc_drops_tzinfo(self):
+        """Test aware UTC datetimes lose tzinfo without shifting."""
+        result = _as_naive_utc(NOW.replace(tzinfo=timezone.utc))
+        assert result == NOW
+        assert result.tzinfo is None
+
+    def test_aware_offset_converted_to_utc(self):
+        """Test aware non-UTC datetimes are converted before dropping tzinfo."""
+        lagos = timezone(timedelta(hours=1))
+        result = _as_naive_utc(datetime(2026, 1, 15, 13, 0, 0, tzinfo=lagos))
+        assert result == NOW
+        assert result.tzinfo is None
+
+
+class TestStaleMessage:
+    """Tests for _stale_message function."""
+
+    def test_message_since_last_activity(self):
+        """Test minutes are counted from the last activity when present."""
+        message = _stale_message(
+            NOW,
+            last_activity=NOW - timedelta(minutes=12, seconds=30),
+            current_phase="scraping",
+            current_platform="bet9ja",
+            started_at=NOW - timedelta(hours=1),
+        )
+        assert message == (
+            "Run stuck in RUNNING for 12min since last activity. "
+            "Last phase: scraping, last platform: bet9ja"
+        )
+
+    def test_aware_last_activity_converted(self):
+        """Test an aware last_activity is compared in UTC."""
+        lagos = timezone(timedelta(hours=1))
+        message = _stale_message(
+            NOW,
+            last_activity=datetime(2026, 1, 15, 12, 50, 0, tzinfo=lagos),
+            current_phase=None,
+            current_platform=None,
+            started_at=NOW - timedelta(hours=1),
+        )
+        assert message.startswith("Run stuck in RUNNING for 10min since last activity.")
+        assert "Last phase: unknown, last platform: unknown" in message
+
+    def test_message_without_activity_uses_started_at(self):
+        """Test minutes are counted from started_at when there is no activity."""
+        started_at = NOW - timedelta(minutes=45)
+        message = _stale_message(
+            NOW,
+            last_activity=None,
+            current_phase=None,
+            current_platform=None,
+            started_at=started_at,
+        )
+        assert message == (
+            "Run stuck in RUNNING for 45min with no phase activity. "
+            f"Started at: {started_at.isoformat()}"
+        )